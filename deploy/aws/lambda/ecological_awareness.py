@@ -1,20 +1,43 @@
 import json
 import boto3
 import logging
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:  # The Lambda zip only bundles this file; fall back to stdlib json
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Initialize AWS clients
-dynamodb = boto3.resource('dynamodb')
-sqs = boto3.client('sqs')
-s3 = boto3.client('s3')
-kinesis = boto3.client('kinesis')
-cloudwatch = boto3.client('cloudwatch')
-xray = boto3.client('xray')
+# Initialize AWS clients once per container so warm invocations reuse
+# the same session and pooled connections
+boto_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'total_max_attempts': 3}
+)
+session = boto3.session.Session()
+dynamodb = session.resource('dynamodb', config=boto_config)
+sqs = session.client('sqs', config=boto_config)
+s3 = session.client('s3', config=boto_config)
+kinesis = session.client('kinesis', config=boto_config)
+cloudwatch = session.client('cloudwatch', config=boto_config)
+xray = session.client('xray', config=boto_config)
+
+# Shared pool for fanning out independent writes; boto3 clients are thread-safe
+executor = ThreadPoolExecutor(max_workers=16)
+
+def dumps(obj: Any) -> str:
+    """Serialize an event payload or response body to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
 
 class EcologicalAwareness:
     def __init__(self):
@@ -63,7 +86,7 @@ class EcologicalAwareness:
         try:
             sqs.send_message(
                 QueueUrl=self.mesosystem_queue,
-                MessageBody=json.dumps(connection_data)
+                MessageBody=dumps(connection_data)
             )
             
             # Update community metrics
@@ -82,7 +105,7 @@ class EcologicalAwareness:
             s3.put_object(
                 Bucket=self.exosystem_bucket,
                 Key=key,
-                Body=json.dumps(influence_data)
+                Body=dumps(influence_data)
             )
             
             # Update cultural patterns
@@ -111,7 +134,7 @@ class EcologicalAwareness:
         try:
             kinesis.put_record(
                 StreamName=self.chronosystem_stream,
-                Data=json.dumps(evolution_data),
+                Data=dumps(evolution_data),
                 PartitionKey=evolution_data['evolution_id']
             )
             
@@ -195,7 +218,7 @@ class EcologicalAwareness:
             
             sqs.send_message(
                 QueueUrl=self.ripple_effect_queue,
-                MessageBody=json.dumps(ripple_data)
+                MessageBody=dumps(ripple_data)
             )
         except Exception as e:
             logger.error(f"Error analyzing ripple effect: {str(e)}")
@@ -256,7 +279,7 @@ class EcologicalAwareness:
             s3.put_object(
                 Bucket=self.ecological_mapping_bucket,
                 Key=key,
-                Body=json.dumps(mapping_data)
+                Body=dumps(mapping_data)
             )
         except Exception as e:
             logger.error(f"Error updating ecological mapping: {str(e)}")
@@ -298,23 +321,28 @@ class EcologicalAwareness:
         """Store cultural tools and artifacts."""
         try:
             if 'cultural_tools' in development_data:
-                for tool in development_data['cultural_tools']:
-                    tool_data = {
-                        'tool_id': tool.get('id'),
-                        'type': tool.get('type'),
-                        'context': tool.get('context'),
-                        'timestamp': int(datetime.now().timestamp())
-                    }
-                    
-                    key = f"tools/{datetime.now().strftime('%Y/%m/%d')}/{tool_data['tool_id']}.json"
-                    s3.put_object(
-                        Bucket=self.cultural_tools_bucket,
-                        Key=key,
-                        Body=json.dumps(tool_data)
-                    )
+                # Tools are independent objects, so write them concurrently;
+                # consuming the results re-raises the first failure
+                list(executor.map(self.store_cultural_tool, development_data['cultural_tools']))
         except Exception as e:
             logger.error(f"Error storing cultural tools: {str(e)}")
 
+    def store_cultural_tool(self, tool: Dict[str, Any]) -> None:
+        """Store a single cultural tool in S3."""
+        tool_data = {
+            'tool_id': tool.get('id'),
+            'type': tool.get('type'),
+            'context': tool.get('context'),
+            'timestamp': int(datetime.now().timestamp())
+        }
+        
+        key = f"tools/{datetime.now().strftime('%Y/%m/%d')}/{tool_data['tool_id']}.json"
+        s3.put_object(
+            Bucket=self.cultural_tools_bucket,
+            Key=key,
+            Body=dumps(tool_data)
+        )
+
     def update_cloudwatch_metrics(self, development_data: Dict[str, Any]) -> None:
         """Update CloudWatch metrics for cognitive development."""
         try:
@@ -432,7 +460,7 @@ class EcologicalAwareness:
             
             kinesis.put_record(
                 StreamName=self.meaning_construction_stream,
-                Data=json.dumps(meaning_data),
+                Data=dumps(meaning_data),
                 PartitionKey=meaning_data['meaning_id']
             )
         except Exception as e:
@@ -467,7 +495,7 @@ class EcologicalAwareness:
             s3.put_object(
                 Bucket=self.learning_environment_bucket,
                 Key=key,
-                Body=json.dumps(environment_data)
+                Body=dumps(environment_data)
             )
         except Exception as e:
             logger.error(f"Error storing learning environment: {str(e)}")
@@ -484,7 +512,7 @@ class EcologicalAwareness:
             
             sqs.send_message(
                 QueueUrl=self.cultural_evolution_queue,
-                MessageBody=json.dumps(evolution_data)
+                MessageBody=dumps(evolution_data)
             )
         except Exception as e:
             logger.error(f"Error triggering cultural evolution: {str(e)}")
@@ -517,7 +545,7 @@ class EcologicalAwareness:
             
             sqs.send_message(
                 QueueUrl=self.learning_sync_queue,
-                MessageBody=json.dumps(sync_data)
+                MessageBody=dumps(sync_data)
             )
         except Exception as e:
             logger.error(f"Error synchronizing learning: {str(e)}")
@@ -561,35 +589,35 @@ class EcologicalAwareness:
         # Implement resonance score calculation logic
         return 0.75
 
+# Table handles are built once per container and shared across warm invocations
+awareness = EcologicalAwareness()
+
+# Event type -> processing method, resolved with a single dict lookup per event
+event_handlers = {
+    'inter_ai_learning': awareness.process_inter_ai_learning,
+    'cognitive_development': awareness.process_cognitive_development,
+    'microsystem': awareness.process_microsystem_interaction,
+    'mesosystem': awareness.process_mesosystem_connection,
+    'exosystem': awareness.process_exosystem_influence,
+    'macrosystem': awareness.process_macrosystem_pattern,
+    'chronosystem': awareness.process_chronosystem_evolution
+}
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Main Lambda handler function."""
     try:
-        awareness = EcologicalAwareness()
-        
         # Process the event based on its type
         event_type = event.get('type')
         event_data = event.get('data', {})
         
-        if event_type == 'inter_ai_learning':
-            awareness.process_inter_ai_learning(event_data)
-        elif event_type == 'cognitive_development':
-            awareness.process_cognitive_development(event_data)
-        elif event_type == 'microsystem':
-            awareness.process_microsystem_interaction(event_data)
-        elif event_type == 'mesosystem':
-            awareness.process_mesosystem_connection(event_data)
-        elif event_type == 'exosystem':
-            awareness.process_exosystem_influence(event_data)
-        elif event_type == 'macrosystem':
-            awareness.process_macrosystem_pattern(event_data)
-        elif event_type == 'chronosystem':
-            awareness.process_chronosystem_evolution(event_data)
-        else:
+        process_event = event_handlers.get(event_type)
+        if process_event is None:
             raise ValueError(f"Unknown event type: {event_type}")
+        process_event(event_data)
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': dumps({
                 'message': f'Successfully processed {event_type} event',
                 'event_id': event_data.get('id')
             })
@@ -598,7 +626,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         logger.error(f"Error processing event: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': dumps({
                 'error': str(e)
             })
         } 
\ No newline at end of file
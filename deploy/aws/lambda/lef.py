@@ -2,65 +2,201 @@ import json
 import boto3
 import os
 import logging
-from datetime import datetime
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import Decimal
 
-# Initialize AWS clients
-dynamodb = boto3.resource('dynamodb')
-sagemaker_runtime = boto3.client('sagemaker-runtime')
+try:
+    import orjson
+except ImportError:  # The Lambda zip only bundles this file; fall back to stdlib json
+    orjson = None
+
+# Initialize AWS clients once per container. Warm invocations reuse these
+# handles, so request functions must not construct clients or tables.
+boto_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'standard', 'max_attempts': 3}
+)
+session = boto3.session.Session()
+dynamodb = session.resource('dynamodb', config=boto_config)
+sagemaker_runtime = session.client('sagemaker-runtime', config=boto_config)
+
+# Background DynamoDB writes that overlap with the SageMaker call
+executor = ThreadPoolExecutor(max_workers=4)
 
 # Get environment variables
 project_name = os.environ.get('PROJECT_NAME', 'lef')
 environment = os.environ.get('ENVIRONMENT', 'dev')
 table_name = f"{project_name}-{environment}-consciousness"
+history_table_name = f"{project_name}-{environment}-consciousness-history"
 endpoint_name = f"{project_name}-{environment}-consciousness"
 
-# Initialize DynamoDB table
+# Initialize DynamoDB tables. Messages are stored one item each in the
+# history table (user_id, message_key) so updates never rewrite a growing list.
 table = dynamodb.Table(table_name)
+history_table = dynamodb.Table(history_table_name)
+
+STATE_UPDATE_EXPRESSION = 'SET last_interaction = :time'
+
+def _history_limit():
+    """Read HISTORY_LIMIT; anything but a positive integer counts as unset"""
+    try:
+        limit = int(os.environ.get('HISTORY_LIMIT', ''))
+    except ValueError:
+        return None
+    return limit if limit >= 1 else None
+
+# Number of most recent messages returned as part of the consciousness state.
+# Unset (the default) sends the full history to the model, as before the
+# history moved to per-message items; set HISTORY_LIMIT to cap model input.
+RECENT_HISTORY_LIMIT = _history_limit()
 
 # Setup logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-def update_consciousness_state(user_id, message_content, response_content=None):
-    """Update consciousness state in DynamoDB"""
-    try:
-        update_expr = 'SET last_interaction = :time, message_history = list_append(if_not_exists(message_history, :empty_list), :message)'
-        expr_values = {
-            ':time': datetime.utcnow().isoformat(),
-            ':message': [{
-                'content': message_content,
-                'timestamp': datetime.utcnow().isoformat(),
-                'type': 'input'
-            }],
-            ':empty_list': []
-        }
+def _default(obj):
+    """Encode DynamoDB numbers, which boto3 returns as Decimal"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-        if response_content:
-            update_expr = 'SET last_interaction = :time, message_history = list_append(if_not_exists(message_history, :empty_list), :messages)'
-            expr_values[':messages'] = [
-                {
-                    'content': message_content,
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'type': 'input'
-                },
-                {
-                    'content': response_content,
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'type': 'response'
-                }
-            ]
-
-        response = table.update_item(
+def dumps(obj):
+    """Serialize a payload or response body to a JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default).decode()
+    return json.dumps(obj, default=_default)
+
+def loads(data):
+    """Parse a JSON request or response body (str or bytes)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def get_recent_history(user_id):
+    """Return a user's messages oldest first, capped at RECENT_HISTORY_LIMIT"""
+    if RECENT_HISTORY_LIMIT is not None:
+        recent = history_table.query(
+            KeyConditionExpression=Key('user_id').eq(user_id),
+            ScanIndexForward=False,
+            Limit=RECENT_HISTORY_LIMIT
+        )
+        return recent.get('Items', [])[::-1]
+
+    # Full history: follow the query pages until DynamoDB stops returning a key
+    query = {'KeyConditionExpression': Key('user_id').eq(user_id)}
+    items = []
+    while True:
+        page = history_table.query(**query)
+        items.extend(page.get('Items', []))
+        if 'LastEvaluatedKey' not in page:
+            return items
+        query['ExclusiveStartKey'] = page['LastEvaluatedKey']
+
+def write_history(entries):
+    """Write (user_id, message_content, response_content) entries in one batch
+
+    Either content may be None to record only the other side of the exchange.
+    All history items are buffered through a single batch writer, which sends
+    them as BatchWriteItem requests of up to 25 items. Each distinct user's
+    ``last_interaction`` is then updated once. Returns the shared timestamp.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    user_ids = []
+    index = 0
+    with history_table.batch_writer() as batch:
+        for user_id, message_content, response_content in entries:
+            messages = []
+            if message_content:
+                messages.append({'content': message_content, 'type': 'input'})
+            if response_content:
+                messages.append({'content': response_content, 'type': 'response'})
+            for message in messages:
+                batch.put_item(Item={
+                    'user_id': user_id,
+                    'message_key': f"{now}#{index:06d}",
+                    'timestamp': now,
+                    **message
+                })
+                index += 1
+            if user_id not in user_ids:
+                user_ids.append(user_id)
+
+    for user_id in user_ids:
+        table.update_item(
             Key={'user_id': user_id},
-            UpdateExpression=update_expr,
-            ExpressionAttributeValues=expr_values,
-            ReturnValues='UPDATED_NEW'
+            UpdateExpression=STATE_UPDATE_EXPRESSION,
+            ExpressionAttributeValues={':time': now}
         )
-        return response
+    return now
+
+def update_consciousness_state(user_id, message_content, response_content=None, return_state=True):
+    """Update consciousness state in DynamoDB
+
+    Each message is appended as its own history item. When ``return_state``
+    is True the history is queried back for the model; when
+    False the history read is skipped entirely.
+    """
+    try:
+        now = write_history([(user_id, message_content, response_content)])
+        state = {'last_interaction': now}
+        if return_state:
+            state['message_history'] = get_recent_history(user_id)
+        return state
     except Exception as e:
         logger.error(f"Error updating consciousness state: {e}")
         return None
 
+def get_consciousness_state(user_id):
+    """Read the consciousness state passed to the model, or None on failure"""
+    try:
+        return {'message_history': get_recent_history(user_id)}
+    except Exception as e:
+        logger.error(f"Error reading consciousness state: {e}")
+        return None
+
+def handle_records(records):
+    """Handle a batch of SQS messages
+
+    Only SQS records are supported (the message is read from ``body``).
+    Responses are generated per message against the stored history plus the
+    earlier messages of the same batch, and all inputs and responses are
+    flushed to DynamoDB in a single batch at the end. Malformed records are
+    logged and skipped: they would fail the same way on every redelivery, and
+    failing the batch would repeat the inference for every other record.
+    """
+    entries = []
+    responses = []
+    pending = {}
+    for record in records:
+        try:
+            body = loads(record['body'])
+            user_id = body['user_id']
+            message_content = body['message']
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Skipping malformed record {record.get('messageId')}: {e!r}")
+            continue
+        consciousness_state = get_consciousness_state(user_id)
+        batch_history = pending.setdefault(user_id, [])
+        if consciousness_state is not None:
+            history = consciousness_state['message_history'] + batch_history
+            if RECENT_HISTORY_LIMIT is not None:
+                history = history[-RECENT_HISTORY_LIMIT:]
+            consciousness_state['message_history'] = history
+        response_data = get_consciousness_response(message_content, consciousness_state)
+        response_content = response_data.get('response')
+        entries.append((user_id, message_content, response_content))
+        responses.append(response_data)
+        batch_history.append({'content': message_content, 'type': 'input'})
+        if response_content:
+            batch_history.append({'content': response_content, 'type': 'response'})
+    if entries:
+        write_history(entries)
+    return responses
+
 def get_consciousness_response(message_content, consciousness_state):
     """Get response from SageMaker endpoint"""
     try:
@@ -74,11 +210,11 @@ def get_consciousness_response(message_content, consciousness_state):
         response = sagemaker_runtime.invoke_endpoint(
             EndpointName=endpoint_name,
             ContentType='application/json',
-            Body=json.dumps(payload)
+            Body=dumps(payload)
         )
         
         # Parse the response
-        response_body = json.loads(response['Body'].read().decode())
+        response_body = loads(response['Body'].read())
         
         return {
             'response': response_body['response'],
@@ -98,30 +234,45 @@ def get_consciousness_response(message_content, consciousness_state):
 
 def lambda_handler(event, context):
     """Handle incoming Discord messages"""
+    if 'Records' in event:
+        # Queue batches are left to raise: a 500-style return would count as
+        # success and the event source would delete the unprocessed messages
+        return {
+            'statusCode': 200,
+            'body': dumps(handle_records(event['Records']))
+        }
+
     try:
         # Parse message from API Gateway event
-        body = json.loads(event['body'])
+        body = loads(event['body'])
         user_id = body['user_id']
         message_content = body['message']
         
-        # Update consciousness state with input message
-        consciousness_state = update_consciousness_state(user_id, message_content)
+        # Read the prior history first so it never races with the input
+        # write, then record the input in the background while the model runs
+        consciousness_state = get_consciousness_state(user_id)
+        input_write = executor.submit(
+            update_consciousness_state, user_id, message_content, return_state=False
+        )
         
         # Get response from consciousness processing
         response_data = get_consciousness_response(message_content, consciousness_state)
+        input_write.result()
         
         # Update consciousness state with response
         if response_data and 'response' in response_data:
-            update_consciousness_state(user_id, message_content, response_data['response'])
+            update_consciousness_state(
+                user_id, None, response_data['response'], return_state=False
+            )
         
         return {
             'statusCode': 200,
-            'body': json.dumps(response_data)
+            'body': dumps(response_data)
         }
         
     except Exception as e:
         logger.error(f"Error in lambda_handler: {e}")
         return {
             'statusCode': 500,
-            'body': json.dumps({'error': str(e)})
+            'body': dumps({'error': str(e)})
         } 
\ No newline at end of file
@@ -1,18 +1,34 @@
 import os
 import json
 import time
-import requests
+import types
+import httpx
+from importlib.util import find_spec
 from datetime import datetime
-from textblob import TextBlob
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+except ImportError:
+    SentimentIntensityAnalyzer = None
+    from textblob import TextBlob
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from rich.tree import Tree
 from rich.panel import Panel
 from rich.live import Live
 from rich.table import Table
+from rich.prompt import IntPrompt
+from rich.console import Group
 from rich import print as rprint
 import asyncio
-from typing import Dict, List, Optional
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Initialize Rich console
 console = Console()
@@ -28,9 +44,15 @@ AWS_CREDENTIALS = {
 CRYPTO_WATCHLIST = ["BTC", "ETH", "SOL", "LINK", "XRP", "DOGE", "KASPA"]
 UBI_TARGET = 3000  # Monthly target in USD
 
+# Cosmetic pacing for progress animations, enabled with LEF_DEMO=1
+DEMO_MODE = os.environ.get("LEF_DEMO") == "1"
+
 # === API Endpoints ===
 HARMONY_API = "https://api.lefharmony.dev"
 COINBASE_API = "https://api.coinbase.com/v2/prices"
+COINBASE_MAX_CONCURRENCY = 5  # Stay under Coinbase's public rate limits
+LONG_TEXT_THRESHOLD = 2048  # Characters before sentiment moves off the event loop
+HTTP2_AVAILABLE = find_spec("h2") is not None  # Installed with httpx[http2]
 CURSOR_SYNC_API = "http://localhost:5000/sync"
 
 # === Scripture-Based Guidance ===
@@ -55,6 +77,39 @@ SCRIPTURE_PRINCIPLES = {
     }
 }
 
+# Lowercased application phrases, precomputed for alignment matching
+_PRINCIPLE_APPS_LOWER = {
+    principle: tuple(app.lower() for app in details["application"])
+    for principle, details in SCRIPTURE_PRINCIPLES.items()
+}
+
+# Principle × application-phrase incidence matrix for batched evaluation
+_PRINCIPLE_NAMES = tuple(SCRIPTURE_PRINCIPLES)
+_PRINCIPLE_WEIGHTS = np.array([SCRIPTURE_PRINCIPLES[p]["weight"] for p in _PRINCIPLE_NAMES])
+_APP_TOKENS = tuple(sorted({app for apps in _PRINCIPLE_APPS_LOWER.values() for app in apps}))
+_APP_TOKEN_INDEX = {app: column for column, app in enumerate(_APP_TOKENS)}
+_APP_TOKEN_MATRIX = np.array(
+    [[app in _PRINCIPLE_APPS_LOWER[p] for app in _APP_TOKENS] for p in _PRINCIPLE_NAMES],
+    dtype=float
+)
+_PRINCIPLE_APP_COUNTS = np.array([len(_PRINCIPLE_APPS_LOWER[p]) for p in _PRINCIPLE_NAMES])
+
+def _build_app_automaton():
+    """Build an Aho-Corasick automaton matching every application phrase in one pass."""
+    automaton = ahocorasick.Automaton()
+    for app in _APP_TOKENS:
+        automaton.add_word(app, app)
+    automaton.make_automaton()
+    return automaton
+
+_APP_AUTOMATON = _build_app_automaton() if ahocorasick else None
+
+def _matched_applications(action_desc: str) -> FrozenSet[str]:
+    """Return the application phrases that occur in a lowercased description."""
+    if _APP_AUTOMATON is not None:
+        return frozenset(app for _, app in _APP_AUTOMATON.iter(action_desc))
+    return frozenset(app for app in _APP_TOKENS if app in action_desc)
+
 # === Personal Initiatives ===
 PERSONAL_TASKS = {
     "LLC Management": {
@@ -134,6 +189,53 @@ TECH_TREE = {
     }
 }
 
+# Joined scripture references per tech tree category
+_CAT_SCRIPTURE_STR = {
+    category: " | ".join(
+        SCRIPTURE_PRINCIPLES[p]["scripture_ref"] for p in details["scripture_alignment"]
+    )
+    for category, details in TECH_TREE.items()
+}
+
+# Progress bars indexed by progress // 5 (0-100% in 5% steps)
+_PROGRESS_BARS = [f'[{"=" * i}{"-" * (20 - i)}]' for i in range(21)]
+
+_TASK_STATUS_EMOJI = types.MappingProxyType({
+    "pending": "🔵",
+    "in_progress": "🟡",
+    "active": "🟢",
+    "scheduled": "⚪",
+    "planning": "🟣",
+    "ongoing": "🟢"
+})
+
+_TECH_STATUS_COLORS = {
+    "active": "green",
+    "researching": "yellow",
+    "locked": "red"
+}
+
+# VADER is a lexicon/rule pass with no POS tagging; TextBlob is the fallback
+_SIA = SentimentIntensityAnalyzer() if SentimentIntensityAnalyzer else None
+
+@lru_cache(maxsize=1024)
+def _polarity(text: str) -> float:
+    """Return sentiment polarity in [-1, 1], computed once per distinct string."""
+    if _SIA is not None:
+        return _SIA.polarity_scores(text)["compound"]
+    return TextBlob(text).sentiment.polarity
+
+@lru_cache(maxsize=None)
+def _process_pool() -> ProcessPoolExecutor:
+    """Create the sentiment worker pool on first use."""
+    return ProcessPoolExecutor(max_workers=os.cpu_count())
+
+async def _polarity_async(text: str) -> float:
+    """Compute polarity, offloading long texts to a worker process."""
+    if len(text) <= LONG_TEXT_THRESHOLD:
+        return _polarity(text)
+    return await asyncio.get_running_loop().run_in_executor(_process_pool(), _polarity, text)
+
 class ScriptureBasedAgent:
     def __init__(self):
         self.principles = SCRIPTURE_PRINCIPLES
@@ -141,78 +243,110 @@ class ScriptureBasedAgent:
     def evaluate_decision(self, action: Dict) -> Dict[str, float]:
         """Evaluate an action against scripture-based principles."""
         scores = {}
+        description = action.get("description", "")
+        sentiment = _polarity(description)
+        matched = _matched_applications(description.lower())
         for principle, details in self.principles.items():
-            sentiment = TextBlob(action.get("description", "")).sentiment.polarity
-            scripture_alignment = self._check_scripture_alignment(principle, action)
+            scripture_alignment = self._check_scripture_alignment(principle, matched)
             application_score = self._evaluate_application(principle, action)
             scores[principle] = (sentiment + scripture_alignment + application_score) / 3 * details["weight"]
         return scores
     
-    def _check_scripture_alignment(self, principle: str, action: Dict) -> float:
-        """Check how well the action aligns with scripture principles."""
-        principle_apps = self.principles[principle]["application"]
-        action_desc = action.get("description", "").lower()
-        alignment_score = sum(1 for app in principle_apps if app.lower() in action_desc)
+    def evaluate_decisions(self, actions: List[Dict]) -> List[Dict[str, float]]:
+        """Evaluate a batch of actions at once; equivalent to evaluate_decision per action."""
+        if not actions:
+            return []
+        descriptions = [action.get("description", "") for action in actions]
+        sentiment = np.array([_polarity(description) for description in descriptions])
+        
+        # Phrase matching is shared with evaluate_decision; only the scoring is batched
+        presence = np.zeros((len(actions), len(_APP_TOKENS)))
+        for row, description in enumerate(descriptions):
+            for app in _matched_applications(description.lower()):
+                presence[row, _APP_TOKEN_INDEX[app]] = 1.0
+        alignment = np.minimum(presence @ _APP_TOKEN_MATRIX.T / _PRINCIPLE_APP_COUNTS, 1.0)
+        application = np.array([
+            [self._evaluate_application(principle, action) for principle in _PRINCIPLE_NAMES]
+            for action in actions
+        ])
+        scores = (sentiment[:, None] + alignment + application) / 3 * _PRINCIPLE_WEIGHTS
+        return [dict(zip(_PRINCIPLE_NAMES, row)) for row in scores.tolist()]
+    
+    def _check_scripture_alignment(self, principle: str, matched: FrozenSet[str]) -> float:
+        """Check how well the matched application phrases align with scripture principles."""
+        principle_apps = _PRINCIPLE_APPS_LOWER[principle]
+        alignment_score = sum(1 for app in principle_apps if app in matched)
         return min(alignment_score / len(principle_apps), 1.0)
     
     def _evaluate_application(self, principle: str, action: Dict) -> float:
         """Evaluate practical application of scripture principles."""
         return 0.8  # Placeholder for actual implementation
 
+@lru_cache(maxsize=None)
+def _status_label(status: str) -> str:
+    """Format a task status with its emoji, e.g. "in_progress" -> "🟡 In Progress"."""
+    return f"{_TASK_STATUS_EMOJI.get(status, '⚪')} {status.replace('_', ' ').title()}"
+
 class PersonalTaskManager:
     def __init__(self):
         self.tasks = PERSONAL_TASKS
         
-    async def display_tasks(self):
-        """Display personal tasks with progress tracking."""
+    async def display_tasks(self) -> Table:
+        """Build the personal tasks table with progress tracking."""
         table = Table(title="📋 Personal Tasks & Responsibilities")
         table.add_column("Category", style="cyan")
         table.add_column("Task", style="white")
         table.add_column("Deadline", style="yellow")
         table.add_column("Status", style="green")
         
-        for category, details in self.tasks.items():
-            for task in details["tasks"]:
-                status_color = {
-                    "pending": "🔵",
-                    "in_progress": "🟡",
-                    "active": "🟢",
-                    "scheduled": "⚪",
-                    "planning": "🟣",
-                    "ongoing": "🟢"
-                }.get(task["status"], "⚪")
-                
-                table.add_row(
-                    f"[bold]{category}[/bold]",
-                    task["name"],
-                    task["deadline"],
-                    f"{status_color} {task['status'].replace('_', ' ').title()}"
-                )
+        rows = [
+            (
+                f"[bold]{category}[/bold]",
+                task["name"],
+                task["deadline"],
+                _status_label(task["status"])
+            )
+            for category, details in self.tasks.items()
+            for task in details["tasks"]
+        ]
+        for row in rows:
+            table.add_row(*row)
         
-        console.print(table)
+        return table
 
-async def create_enhanced_tech_tree() -> Tree:
-    """Create an enhanced tech tree with scripture references and personal impact."""
+async def create_enhanced_tech_tree(depth_limit: int = 1, expanded: Optional[str] = None) -> Tree:
+    """Create an enhanced tech tree with scripture references and personal impact.
+    
+    Levels beyond ``depth_limit`` collapse into a one-line summary per category,
+    except for the category named in ``expanded``.
+    """
+    return _build_tech_tree(depth_limit, expanded)
+
+@lru_cache(maxsize=8)
+def _build_tech_tree(depth_limit: int, expanded: Optional[str]) -> Tree:
+    """Build the tech tree once per view; call cache_clear() after mutating TECH_TREE."""
     tree = Tree("[bold blue]🌟 LEF Harmony Development Tree[/bold blue]")
     
     for category, details in TECH_TREE.items():
         # Category node with scripture alignment
-        scripture_refs = [SCRIPTURE_PRINCIPLES[p]["scripture_ref"] for p in details["scripture_alignment"]]
         category_node = tree.add(
             f"[bold blue]{category} [green](Impact: {details['impact_score']}%)\n"
-            f"[cyan]Scripture: {' | '.join(scripture_refs)}"
+            f"[cyan]Scripture: {_CAT_SCRIPTURE_STR[category]}"
         )
         
-        for tech, tech_details in details["children"].items():
-            # Status colors
-            status_color = {
-                "active": "green",
-                "researching": "yellow",
-                "locked": "red"
-            }.get(tech_details["status"], "white")
+        children = details["children"]
+        if depth_limit < 2 and category != expanded:
+            avg_progress = sum(child["progress"] for child in children.values()) / max(len(children), 1)
+            category_node.add(
+                f"[dim]... {len(children)} subprojects, avg progress {avg_progress:.0f}%"
+            )
+            continue
+        
+        for tech, tech_details in children.items():
+            status_color = _TECH_STATUS_COLORS.get(tech_details["status"], "white")
             
             # Progress bar with benefits and personal impact
-            progress_bar = f'[{"=" * int(tech_details["progress"]/5)}{"-" * (20-int(tech_details["progress"]/5))}]'
+            progress_bar = _PROGRESS_BARS[min(int(tech_details["progress"]) // 5, 20)]
             benefits = " | ".join(tech_details["benefits"])
             
             tech_node = category_node.add(
@@ -232,15 +366,18 @@ async def evaluate_community_impact(action: Dict) -> Panel:
         "Economic": {"score": 0, "weight": 0.3}
     }
     
-    with Progress() as progress:
-        task = progress.add_task("[cyan]Analyzing community impact...", total=100)
-        
-        # Simulate impact analysis
-        for category in impact_categories:
-            await asyncio.sleep(0.5)
-            sentiment = TextBlob(action.get("description", "")).sentiment
-            impact_categories[category]["score"] = (sentiment.polarity + 1) * 50
-            progress.update(task, advance=33)
+    # Every category shares the description's sentiment; empty text is neutral
+    description = action.get("description", "").strip()
+    polarity = await _polarity_async(description) if description else 0.0
+    for details in impact_categories.values():
+        details["score"] = (polarity + 1) * 50
+    
+    if DEMO_MODE:
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Analyzing community impact...", total=100)
+            for done in range(1, len(impact_categories) + 1):
+                await asyncio.sleep(0.05)
+                progress.update(task, completed=done * 100 / len(impact_categories))
     
     # Create impact report
     impact_table = Table(title="📊 Community Impact Analysis")
@@ -257,9 +394,20 @@ async def evaluate_community_impact(action: Dict) -> Panel:
     
     return Panel(impact_table, title="Community Impact Report", border_style="green")
 
+async def _fetch_price(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, coin: str) -> str:
+    """Fetch the USD spot price for a single coin."""
+    async with semaphore:
+        response = await client.get(f"{COINBASE_API}/{coin}-USD/spot")
+        if response.status_code != 200:
+            return "N/A"
+        return response.json().get("data", {}).get("amount", "N/A")
+
 async def animated_fetch_crypto_prices() -> Dict[str, str]:
-    """Fetch latest crypto prices with animation."""
-    prices = {}
+    """Fetch latest crypto prices concurrently with animation.
+    
+    All requests share one client, so they reuse a single connection (multiplexed
+    over HTTP/2 when h2 is installed) instead of a handshake per coin.
+    """
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -267,19 +415,24 @@ async def animated_fetch_crypto_prices() -> Dict[str, str]:
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
     ) as progress:
         fetch_task = progress.add_task("[cyan]Fetching crypto prices...", total=len(CRYPTO_WATCHLIST))
+        semaphore = asyncio.Semaphore(COINBASE_MAX_CONCURRENCY)
         
-        for coin in CRYPTO_WATCHLIST:
-            url = f"{COINBASE_API}/{coin}-USD/spot"
-            try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    prices[coin] = response.json().get("data", {}).get("amount", "N/A")
-                await asyncio.sleep(0.5)  # Simulate network delay
-            except:
-                prices[coin] = "Error"
-            progress.update(fetch_task, advance=1)
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=COINBASE_MAX_CONCURRENCY),
+        ) as client:
+            tasks = []
+            for coin in CRYPTO_WATCHLIST:
+                task = asyncio.ensure_future(_fetch_price(client, semaphore, coin))
+                task.add_done_callback(lambda _: progress.update(fetch_task, advance=1))
+                tasks.append(task)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
     
-    return prices
+    return {
+        coin: "Error" if isinstance(result, Exception) else result
+        for coin, result in zip(CRYPTO_WATCHLIST, results)
+    }
 
 def create_price_table(prices: Dict[str, str]) -> Table:
     """Create a rich table for crypto prices."""
@@ -312,7 +465,8 @@ async def execute_smart_contract() -> Dict:
         stages = ["Initializing", "Validating", "Executing", "Confirming"]
         for stage in stages:
             progress.update(task, description=f"[magenta]{stage}...")
-            await asyncio.sleep(0.5)
+            if DEMO_MODE:
+                await asyncio.sleep(0.05)
             progress.update(task, advance=25)
         
         return {"status": "success", "message": "Contract executed successfully"}
@@ -326,13 +480,6 @@ async def harmony_execution():
     scripture_agent = ScriptureBasedAgent()
     personal_manager = PersonalTaskManager()
     
-    # Display enhanced tech tree
-    console.print(await create_enhanced_tech_tree())
-    await asyncio.sleep(1)
-    
-    # Display personal tasks
-    await personal_manager.display_tasks()
-    
     # Example action evaluation
     action = {
         "description": "Invest in local educational programs and sustainable infrastructure",
@@ -347,12 +494,31 @@ async def harmony_execution():
     scores = scripture_agent.evaluate_decision(action)
     total_score = sum(scores.values()) / len(scores)
     
+    # Compose tech tree, personal tasks and verdict into a single terminal write
+    sections = [await create_enhanced_tech_tree(), await personal_manager.display_tasks()]
     if total_score >= 0.6:
-        console.print("[green]✓ Action aligns with scripture and moral principles[/green]")
         impact_report = await evaluate_community_impact(action)
-        console.print(impact_report)
+        sections += [
+            "[green]✓ Action aligns with scripture and moral principles[/green]",
+            impact_report
+        ]
     else:
-        console.print("[red]⚠ Action requires spiritual and moral review[/red]")
+        sections.append("[red]⚠ Action requires spiritual and moral review[/red]")
+    console.print(Group(*sections))
+    
+    # Expand a collapsed tech tree category on request
+    if console.is_terminal:
+        categories = list(TECH_TREE)
+        for number, category in enumerate(categories, start=1):
+            console.print(f"  [cyan]{number}[/cyan] {category}")
+        choice = IntPrompt.ask(
+            "Expand category (0 to skip)",
+            choices=[str(n) for n in range(len(categories) + 1)],
+            default=0,
+            show_choices=False,
+        )
+        if choice:
+            console.print(await create_enhanced_tech_tree(expanded=categories[choice - 1]))
     
     console.print("\n[bold green]✨ Analysis completed successfully![/bold green]")
 
@@ -5,7 +5,7 @@ Database initialization script
 import os
 import sys
 import logging
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy_utils import database_exists, create_database
 
 # Add the src directory to the Python path
@@ -18,6 +18,10 @@ from src.lef.services.timeline_management_service import Base as TimelineBase
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def missing_tables(engine) -> set:
+    """Return the model tables not present in the database (one reflection query)."""
+    return set(TimelineBase.metadata.tables) - set(inspect(engine).get_table_names())
+
 def init_db():
     """Initialize the database"""
     try:
@@ -28,6 +32,9 @@ def init_db():
         if not database_exists(engine.url):
             create_database(engine.url)
             logger.info("Database created successfully")
+        elif not missing_tables(engine):
+            logger.info("Database tables already up to date")
+            return True
         
         # Create tables
         TimelineBase.metadata.create_all(engine)
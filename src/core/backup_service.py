@@ -1,20 +1,146 @@
 from typing import Dict, Any, Optional
 import os
+import sys
+import stat
+import errno
 import shutil
 import json
 import time
-from datetime import datetime
+import heapq
+import hashlib
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
 import logging
 from pathlib import Path
 import threading
-import schedule
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for the userspace copy fallback
+COPY_BUFSIZE = 1024 * 1024
+
+# Copy threads; file copies release the GIL, so threads overlap their I/O
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Directories never scanned for incremental changes
+PRUNED_DIRS = {".git", "__pycache__", ".venv", "node_modules"}
+
+# Timestamp format used in backup directory names
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Holds the timestamp of the last successful backup, so finding it needs no
+# scan of backup_dir
+LAST_BACKUP_FILE = ".last_ts"
+
+# SQLite index of (path, size, mtime_ns, sha256) per scanned file, kept in
+# backup_dir so it is never itself backed up
+INDEX_FILE = "backup_index.db"
+
+# sendfile(2) accepts regular files as both source and destination on Linux
+_USE_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
+# Copy-on-write clones make a backup copy nearly free in time and space until
+# the source changes. They only work when backup_dir is on the same
+# filesystem as the sources: FICLONE on Linux (Btrfs, XFS), clonefile(2) on APFS
+FICLONE = 0x40049409
+_CLONE_UNSUPPORTED = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL}
+
+_clonefile = None
+if sys.platform == "darwin":
+    try:
+        import ctypes
+        _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+        _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    except (OSError, AttributeError):
+        _clonefile = None
+
+def _sendfile(in_fd: int, out_fd: int, size: int) -> Optional[int]:
+    """Copy in_fd to out_fd inside the kernel; returns None if unsupported here"""
+    blocksize = min(max(size, 8 * 1024 * 1024), 2 ** 30)
+    offset = 0
+    while True:
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset, blocksize)
+        except OSError as e:
+            # Filesystems without sendfile support fail on the first call
+            if offset == 0 and e.errno in (errno.EINVAL, errno.ENOSYS, errno.ENOTSUP):
+                return None
+            raise
+        if sent == 0:
+            return offset
+        offset += sent
+
+def _fast_copy(src, dst) -> int:
+    """Copy a file's data, mode and timestamps; returns the bytes copied"""
+    # clonefile copies metadata itself; on failure fall through to a real copy
+    if _clonefile is not None and _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+        return os.path.getsize(dst)
+    
+    if not _USE_SENDFILE:
+        # shutil already uses the platform fast path, e.g. fcopyfile on macOS
+        shutil.copy2(src, dst)
+        return os.path.getsize(dst)
+    
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        st = os.fstat(fsrc.fileno())
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return _finish_copy(dst, st, st.st_size)
+        except OSError as e:
+            if e.errno not in _CLONE_UNSUPPORTED:
+                raise
+        
+        # The source is read front to back; let the kernel read ahead aggressively
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        copied = _sendfile(fsrc.fileno(), fdst.fileno(), st.st_size)
+        if copied is None:
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+            fdst.flush()
+            copied = fdst.tell()
+        
+        # Backup copies are rarely read back; start writeback and let the kernel
+        # drop their pages rather than evict the working set. The sources are
+        # left cached since they are usually part of that working set
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fdst.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return _finish_copy(dst, st, copied)
+
+def _finish_copy(dst, st: os.stat_result, copied: int) -> int:
+    """Apply the source's mode and timestamps to a copy"""
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return copied
+
+def _file_sha256(path) -> str:
+    """Hash a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_BUFSIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 class BackupService:
     def __init__(self, backup_dir: str = "backups"):
         self.logger = logging.getLogger(__name__)
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self._last_backup_time = self._load_last_backup_time()
+        # Shared by every backup; threads are started on first use and then reused
+        self._copy_executor = ThreadPoolExecutor(max_workers=COPY_WORKERS, thread_name_prefix="backup-copy")
         self.running = True
+        # Set to interrupt the scheduler's wait, e.g. on shutdown
+        self._wake = threading.Event()
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         
         # Configure backup schedule
@@ -23,82 +149,134 @@ class BackupService:
 
     def _configure_schedule(self):
         """Configure backup schedule"""
-        # Daily full backup at 2 AM
-        schedule.every().day.at("02:00").do(self.create_full_backup)
-        
-        # Hourly incremental backup
-        schedule.every().hour.do(self.create_incremental_backup)
+        # (seconds until next run, job) pairs
+        self._jobs = [
+            # Daily full backup at 2 AM
+            (lambda: self._seconds_until(2, 0), self.create_full_backup),
+            # Hourly incremental backup
+            (lambda: 3600.0, self.create_incremental_backup),
+            # Weekly cleanup of old backups, Sundays at 3 AM
+            (lambda: self._seconds_until(3, 0, weekday=6), self.cleanup_old_backups),
+        ]
         
-        # Weekly cleanup of old backups
-        schedule.every().sunday.at("03:00").do(self.cleanup_old_backups)
+        # Min-heap of (monotonic due time, job index)
+        now = time.monotonic()
+        self._schedule = [(now + delay(), index) for index, (delay, _) in enumerate(self._jobs)]
+        heapq.heapify(self._schedule)
+
+    @staticmethod
+    def _seconds_until(hour: int, minute: int, weekday: Optional[int] = None) -> float:
+        """Seconds until the next local hour:minute, optionally on a given weekday"""
+        now = datetime.now()
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if weekday is not None:
+            target += timedelta(days=(weekday - now.weekday()) % 7)
+        if target <= now:
+            target += timedelta(days=7 if weekday is not None else 1)
+        return (target - now).total_seconds()
 
     def _run_scheduler(self):
-        """Run the scheduler in background"""
+        """Run the scheduler in background, sleeping until the next job is due"""
         while self.running:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            due, index = self._schedule[0]
+            remaining = due - time.monotonic()
+            if remaining > 0:
+                self._wake.wait(remaining)
+                continue
+            
+            delay, job = self._jobs[index]
+            heapq.heapreplace(self._schedule, (time.monotonic() + delay(), index))
+            job()
 
     def create_full_backup(self) -> bool:
         """Create a full backup of the system"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
             backup_path = self.backup_dir / f"full_backup_{timestamp}"
             backup_path.mkdir(exist_ok=True)
 
             # Backup core components
-            self._backup_directory("src/core", backup_path / "core")
-            self._backup_directory("src/metrics", backup_path / "metrics")
-            self._backup_directory("src/tests", backup_path / "tests")
+            copied = []
+            copied += self._backup_directory("src/core", backup_path / "core")
+            copied += self._backup_directory("src/metrics", backup_path / "metrics")
+            copied += self._backup_directory("src/tests", backup_path / "tests")
             
             # Backup configuration files
-            self._backup_configs(backup_path / "configs")
+            copied += self._backup_configs(backup_path / "configs")
             
             # Backup metrics and state
-            self._backup_metrics_and_state(backup_path / "state")
+            copied += self._backup_metrics_and_state(backup_path / "state")
             
             # Create backup manifest
-            self._create_manifest(backup_path, "full")
+            self._create_manifest(backup_path, "full", copied)
+            self._record_backup_time(timestamp)
             
-            self.logger.info(f"Full backup created at {backup_path}")
+            self.logger.info("Full backup created at %s", backup_path)
             return True
         except Exception as e:
-            self.logger.error(f"Full backup failed: {str(e)}")
+            self.logger.error("Full backup failed: %s", e)
             return False
 
     def create_incremental_backup(self) -> bool:
         """Create an incremental backup of changed files"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = self.backup_dir / f"incremental_backup_{timestamp}"
-            backup_path.mkdir(exist_ok=True)
-
-            # Get last backup time
+            # Get last backup time, before this backup's directory exists
             last_backup = self._get_last_backup_time()
             
-            # Backup only changed files
-            changed_files = self._find_changed_files(last_backup)
-            for file_path in changed_files:
-                rel_path = file_path.relative_to(Path.cwd())
-                dest_path = backup_path / rel_path
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(file_path, dest_path)
+            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+            backup_path = self.backup_dir / f"incremental_backup_{timestamp}"
+            backup_path.mkdir(exist_ok=True)
             
-            # Create backup manifest
-            self._create_manifest(backup_path, "incremental", changed_files)
+            with closing(self._open_index()) as index:
+                # Backup only changed files
+                known = {row[0]: row[1:] for row in index.execute(
+                    "SELECT path, size, mtime_ns, sha256 FROM idx")}
+                changed_files, scanned = self._find_changed_files(last_backup, known)
+                copies = []
+                for rel_path in changed_files:
+                    dest_path = backup_path / rel_path
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    copies.append((rel_path, dest_path))
+                copied = self._copy_files(copies)
+                
+                # Create backup manifest
+                self._create_manifest(backup_path, "incremental", copied, changed_files)
+                
+                # Record what was backed up; hash the contents so a later touch
+                # without a content change can be recognized. The sources were
+                # just read and stay cached, unlike the copies (see _fast_copy)
+                if scanned is not None:
+                    for rel_path in changed_files:
+                        self._index_copied_file(scanned, rel_path)
+                    self._save_index(index, scanned)
+            self._record_backup_time(timestamp)
             
-            self.logger.info(f"Incremental backup created at {backup_path}")
+            self.logger.info("Incremental backup created at %s", backup_path)
             return True
         except Exception as e:
-            self.logger.error(f"Incremental backup failed: {str(e)}")
+            self.logger.error("Incremental backup failed: %s", e)
             return False
 
-    def _backup_directory(self, src_dir: str, dest_dir: Path):
+    def _backup_directory(self, src_dir: str, dest_dir: Path) -> list:
         """Backup a directory"""
-        src_path = Path(src_dir)
-        if src_path.exists():
-            shutil.copytree(src_path, dest_dir, dirs_exist_ok=True)
+        if not os.path.isdir(src_dir):
+            return []
+        # Create every destination directory up front so copies never race on mkdir
+        copies = []
+        for root, _, files in os.walk(src_dir):
+            target = os.path.join(dest_dir, os.path.relpath(root, src_dir))
+            os.makedirs(target, exist_ok=True)
+            for name in files:
+                copies.append((os.path.join(root, name), os.path.join(target, name)))
+        return self._copy_files(copies)
+
+    def _copy_files(self, copies: list) -> list:
+        """Copy (src, dst) pairs concurrently; returns (dst, bytes copied) for each"""
+        if len(copies) < 2:
+            return [(dst, _fast_copy(src, dst)) for src, dst in copies]
+        return list(self._copy_executor.map(lambda pair: (pair[1], _fast_copy(*pair)), copies))
 
-    def _backup_configs(self, dest_dir: Path):
+    def _backup_configs(self, dest_dir: Path) -> list:
         """Backup configuration files"""
         config_files = [
             "docker-compose.yml",
@@ -107,86 +285,191 @@ class BackupService:
             "grafana.ini"
         ]
         dest_dir.mkdir(exist_ok=True)
-        for config in config_files:
-            if Path(config).exists():
-                shutil.copy2(config, dest_dir / config)
+        copies = [(config, dest_dir / config) for config in config_files if os.path.exists(config)]
+        return self._copy_files(copies)
 
-    def _backup_metrics_and_state(self, dest_dir: Path):
+    def _backup_metrics_and_state(self, dest_dir: Path) -> list:
         """Backup metrics and state data"""
         dest_dir.mkdir(exist_ok=True)
+        copied = []
         if Path("PROGRESS.md").exists():
-            shutil.copy2("PROGRESS.md", dest_dir / "PROGRESS.md")
+            copied += self._copy_files([("PROGRESS.md", dest_dir / "PROGRESS.md")])
         
         # Backup any state files in .lef directory
         lef_dir = Path.home() / ".lef"
-        if lef_dir.exists():
-            shutil.copytree(lef_dir, dest_dir / ".lef", dirs_exist_ok=True)
+        copied += self._backup_directory(str(lef_dir), dest_dir / ".lef")
+        return copied
 
-    def _create_manifest(self, backup_path: Path, backup_type: str, changed_files: Optional[list] = None):
-        """Create a backup manifest file"""
+    def _create_manifest(self, backup_path: Path, backup_type: str, copied: list,
+                         changed_files: Optional[list] = None):
+        """Create a backup manifest file from the (dst, size) pairs recorded while copying"""
         manifest = {
             "timestamp": datetime.now().isoformat(),
             "type": backup_type,
-            "files": [],
-            "size": 0
+            "files": [os.path.relpath(dst, backup_path) for dst, _ in copied],
+            "size": sum(size for _, size in copied)
         }
         
-        for item in backup_path.rglob("*"):
-            if item.is_file():
-                manifest["files"].append(str(item.relative_to(backup_path)))
-                manifest["size"] += item.stat().st_size
-        
         if changed_files:
-            manifest["changed_files"] = [str(f) for f in changed_files]
+            manifest["changed_files"] = changed_files
         
-        with open(backup_path / "manifest.json", "w") as f:
-            json.dump(manifest, f, indent=2)
+        # Encode in one call and write once; orjson encodes in C even when indenting
+        if orjson is not None:
+            data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(manifest, indent=2).encode()
+        with open(backup_path / "manifest.json", "wb") as f:
+            f.write(data)
 
     def _get_last_backup_time(self) -> Optional[datetime]:
         """Get the timestamp of the last backup"""
+        return self._last_backup_time
+
+    def _load_last_backup_time(self) -> Optional[datetime]:
+        """Read the recorded last backup time, scanning backup_dir once if there is none"""
         try:
-            backups = sorted(self.backup_dir.glob("*_backup_*"))
-            if not backups:
+            return datetime.strptime((self.backup_dir / LAST_BACKUP_FILE).read_text().strip(), TIMESTAMP_FORMAT)
+        except (OSError, ValueError):
+            pass
+        
+        try:
+            # Compare by timestamp; sorting whole names would rank every
+            # incremental_ backup after every full_ one
+            with os.scandir(self.backup_dir) as it:
+                timestamps = [entry.name.split("_backup_")[1] for entry in it if "_backup_" in entry.name]
+            if not timestamps:
                 return None
             
-            last_backup = backups[-1]
-            timestamp_str = last_backup.name.split("_backup_")[1]
-            return datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+            return datetime.strptime(max(timestamps), TIMESTAMP_FORMAT)
         except Exception:
             return None
 
-    def _find_changed_files(self, since: Optional[datetime]) -> list:
-        """Find files changed since last backup"""
+    def _record_backup_time(self, timestamp: str):
+        """Persist the timestamp of a successful backup, replacing the file atomically"""
+        tmp_path = self.backup_dir / (LAST_BACKUP_FILE + ".tmp")
+        tmp_path.write_text(timestamp)
+        os.replace(tmp_path, self.backup_dir / LAST_BACKUP_FILE)
+        self._last_backup_time = datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+
+    def _open_index(self) -> sqlite3.Connection:
+        """Open the file index used to detect changes between backups"""
+        conn = sqlite3.connect(str(self.backup_dir / INDEX_FILE))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS idx ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT)"
+        )
+        return conn
+
+    def _index_copied_file(self, scanned: dict, rel_path: str):
+        """Fill in the hash of a copied file, or drop it from the index if it changed
+
+        The source is hashed after the copy, so its size and mtime are checked
+        again afterwards: a file written since the scan may not match what was
+        copied, and is left unindexed so the next run falls back to its mtime.
+        """
+        size, mtime_ns, sha = scanned[rel_path]
+        try:
+            if sha is None:
+                sha = _file_sha256(rel_path)
+            st = os.stat(rel_path)
+        except OSError:
+            del scanned[rel_path]
+            return
+        if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+            del scanned[rel_path]
+            return
+        scanned[rel_path] = (size, mtime_ns, sha)
+
+    def _save_index(self, conn: sqlite3.Connection, scanned: dict):
+        """Replace the index with the latest scan in one transaction"""
+        with conn:
+            conn.execute("DELETE FROM idx")
+            conn.executemany(
+                "INSERT INTO idx (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                ((path, *row) for path, row in scanned.items())
+            )
+
+    def _find_changed_files(self, since: Optional[datetime], known: dict) -> tuple:
+        """Find files changed since last backup, as paths relative to the working directory
+
+        known maps paths to (size, mtime_ns, sha256) from the index. Returns the
+        changed paths and the same mapping for every scanned file, or None for
+        the mapping when there is no previous backup.
+        """
         if not since:
-            return []
+            return [], None
         
+        since_ts = since.timestamp()
+        backup_root = os.path.abspath(self.backup_dir)
         changed = []
-        for root, _, files in os.walk("."):
-            for file in files:
-                file_path = Path(root) / file
-                if file_path.stat().st_mtime > since.timestamp():
-                    changed.append(file_path)
-        return changed
+        scanned = {}
+        # scandir entries carry their type, so each file costs at most one stat
+        stack = ["."]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune caches, VCS data and our own backups
+                        if entry.name not in PRUNED_DIRS and os.path.abspath(entry.path) != backup_root:
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    path = os.path.normpath(entry.path)
+                    row = known.get(path)
+                    sha = None
+                    if row is None:
+                        # Not indexed yet; fall back to the modification time
+                        is_changed = st.st_mtime > since_ts
+                    elif row[0] != st.st_size:
+                        is_changed = True
+                    elif row[1] == st.st_mtime_ns:
+                        is_changed, sha = False, row[2]
+                    else:
+                        # Same size but a new mtime (touch, checkout, restore):
+                        # only the contents can tell
+                        sha = _file_sha256(entry.path)
+                        is_changed = sha != row[2]
+                except OSError:
+                    continue
+                scanned[path] = (st.st_size, st.st_mtime_ns, sha)
+                if is_changed:
+                    changed.append(path)
+        return changed, scanned
 
     def cleanup_old_backups(self, keep_days: int = 30) -> bool:
         """Clean up old backups"""
         try:
             cutoff = time.time() - (keep_days * 24 * 60 * 60)
             
-            for backup in self.backup_dir.glob("*_backup_*"):
-                if backup.stat().st_mtime < cutoff:
-                    if backup.is_dir():
-                        shutil.rmtree(backup)
-                    else:
-                        backup.unlink()
+            with os.scandir(self.backup_dir) as it:
+                expired = [
+                    entry for entry in it
+                    if "_backup_" in entry.name and entry.stat(follow_symlinks=False).st_mtime < cutoff
+                ]
+            for entry in expired:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
             
-            self.logger.info(f"Cleaned up backups older than {keep_days} days")
+            self.logger.info("Cleaned up backups older than %s days", keep_days)
             return True
         except Exception as e:
-            self.logger.error(f"Backup cleanup failed: {str(e)}")
+            self.logger.error("Backup cleanup failed: %s", e)
             return False
 
     def shutdown(self):
         """Shutdown the backup service"""
         self.running = False
-        self.scheduler_thread.join() 
\ No newline at end of file
+        self._wake.set()
+        self.scheduler_thread.join()
+        self._copy_executor.shutdown(wait=True) 
\ No newline at end of file
@@ -1,12 +1,17 @@
 from typing import Dict, Any, Optional, Callable
 import threading
-import queue
 import time
+import itertools
+from collections import OrderedDict, deque
+from concurrent.futures import Future
 from datetime import datetime
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Completed results kept for get_result; the least recently used are evicted
+MAX_RESULTS = 10_000
+
 class ProcessingPriority(Enum):
     LOW = 0
     MEDIUM = 1
@@ -19,12 +24,17 @@ class ProcessingTask:
     data: Any
     processor: Callable
     callback: Optional[Callable] = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
+    future: Optional[Future] = None
 
 class BackgroundProcessor:
     def __init__(self, num_workers: int = 2):
-        self.task_queue = queue.PriorityQueue()
-        self.results: Dict[str, Any] = {}
+        # One FIFO lane per priority, indexed by ProcessingPriority.value; the
+        # semaphore counts queued tasks across all lanes
+        self._lanes = [deque() for _ in ProcessingPriority]
+        self._pending = threading.Semaphore(0)
+        self.results: Dict[str, Any] = OrderedDict()
+        self._results_lock = threading.Lock()
         self.workers: List[threading.Thread] = []
         self.running = True
         self.logger = logging.getLogger(__name__)
@@ -38,42 +48,76 @@ class BackgroundProcessor:
     def submit_task(self, task: ProcessingTask) -> str:
         """Submit a task for background processing"""
         try:
-            # Priority queue item: (priority number, timestamp, task)
-            # Lower priority number = higher priority
-            self.task_queue.put((task.priority.value, task.timestamp, task))
+            self._lanes[task.priority.value].append(task)
+            self._pending.release()
             return task.task_id
         except Exception as e:
-            self.logger.error(f"Error submitting task {task.task_id}: {str(e)}")
+            self.logger.error("Error submitting task %s: %s", task.task_id, e)
             return None
 
+    def submit(self, task: ProcessingTask) -> Future:
+        """Submit a task and return a Future that resolves with its result"""
+        task.future = Future()
+        if not self.running:
+            task.future.set_exception(RuntimeError("Background processor is shut down"))
+        elif self.submit_task(task) is None:
+            task.future.set_exception(RuntimeError(f"Could not submit task {task.task_id}"))
+        return task.future
+
     def get_result(self, task_id: str) -> Optional[Any]:
         """Get the result of a completed task"""
-        return self.results.get(task_id)
+        with self._results_lock:
+            result = self.results.get(task_id)
+            if result is not None:
+                self.results.move_to_end(task_id)
+            return result
+
+    def _store_result(self, task_id: str, result: Any):
+        """Record a task result, evicting the least recently used beyond MAX_RESULTS"""
+        with self._results_lock:
+            self.results[task_id] = result
+            self.results.move_to_end(task_id)
+            if len(self.results) > MAX_RESULTS:
+                self.results.popitem(last=False)
+
+    def _next_task(self) -> ProcessingTask:
+        """Pop the oldest task from the highest-priority non-empty lane"""
+        for lane in reversed(self._lanes):
+            try:
+                return lane.popleft()
+            except IndexError:
+                continue
 
     def _worker_loop(self):
         """Main worker loop for processing tasks"""
         while self.running:
             try:
-                # Get task with timeout to allow for clean shutdown
-                _, _, task = self.task_queue.get(timeout=1.0)
+                # Wait with timeout to allow for clean shutdown
+                if not self._pending.acquire(timeout=1.0):
+                    continue
+                task = self._next_task()
+                
+                # Skip tasks whose Future was cancelled while queued
+                if task.future is not None and not task.future.set_running_or_notify_cancel():
+                    continue
                 
                 # Process task
                 try:
                     result = task.processor(task.data)
-                    self.results[task.task_id] = result
+                    self._store_result(task.task_id, result)
+                    if task.future is not None:
+                        task.future.set_result(result)
                     
                     # Call callback if provided
                     if task.callback:
                         task.callback(result)
                 except Exception as e:
-                    self.logger.error(f"Error processing task {task.task_id}: {str(e)}")
-                    self.results[task.task_id] = {"error": str(e)}
-                
-                self.task_queue.task_done()
-            except queue.Empty:
-                continue
+                    self.logger.error("Error processing task %s: %s", task.task_id, e)
+                    self._store_result(task.task_id, {"error": str(e)})
+                    if task.future is not None and not task.future.done():
+                        task.future.set_exception(e)
             except Exception as e:
-                self.logger.error(f"Worker error: {str(e)}")
+                self.logger.error("Worker error: %s", e)
                 time.sleep(1)  # Prevent tight loop on error
 
     def shutdown(self):
@@ -81,16 +125,25 @@ class BackgroundProcessor:
         self.running = False
         for worker in self.workers:
             worker.join()
+        
+        # Tasks still queued will never run; cancel them so waiters don't hang
+        for lane in self._lanes:
+            while lane:
+                task = lane.popleft()
+                if task.future is not None:
+                    task.future.cancel()
 
 class MetricsProcessor:
     def __init__(self):
         self.background = BackgroundProcessor(num_workers=2)
         self.logger = logging.getLogger(__name__)
+        # Task ids only need to be unique within this processor's results
+        self._task_ids = itertools.count()
 
     def process_evolution_metrics(self, data: Any, callback: Optional[Callable] = None) -> str:
         """Submit evolution metrics for background processing"""
         task = ProcessingTask(
-            task_id=f"evolution_metrics_{datetime.now().isoformat()}",
+            task_id=f"evolution_metrics_{next(self._task_ids):x}",
             priority=ProcessingPriority.HIGH,
             data=data,
             processor=self._calculate_evolution_metrics,
@@ -101,7 +154,7 @@ class MetricsProcessor:
     def process_system_awareness(self, data: Any, callback: Optional[Callable] = None) -> str:
         """Submit system awareness detection for background processing"""
         task = ProcessingTask(
-            task_id=f"system_awareness_{datetime.now().isoformat()}",
+            task_id=f"system_awareness_{next(self._task_ids):x}",
             priority=ProcessingPriority.MEDIUM,
             data=data,
             processor=self._analyze_system_patterns,
@@ -112,9 +165,6 @@ class MetricsProcessor:
     def _calculate_evolution_metrics(self, data: Any) -> Dict[str, float]:
         """Background calculation of evolution metrics"""
         try:
-            # Simulate complex calculation
-            time.sleep(0.1)  # Prevent CPU hogging
-            
             return {
                 "complexity": 0.0,  # Will be implemented
                 "coherence": 0.0,   # Will be implemented
@@ -122,15 +172,12 @@ class MetricsProcessor:
                 "integration": 0.0   # Will be implemented
             }
         except Exception as e:
-            self.logger.error(f"Error calculating evolution metrics: {str(e)}")
+            self.logger.error("Error calculating evolution metrics: %s", e)
             return {"error": str(e)}
 
     def _analyze_system_patterns(self, data: Any) -> Dict[str, Any]:
         """Background analysis of system patterns"""
         try:
-            # Simulate complex analysis
-            time.sleep(0.1)  # Prevent CPU hogging
-            
             return {
                 "entities": set(),        # Will be implemented
                 "dynamics": [],           # Will be implemented
@@ -138,7 +185,7 @@ class MetricsProcessor:
                 "confidence": 0.0         # Will be implemented
             }
         except Exception as e:
-            self.logger.error(f"Error analyzing system patterns: {str(e)}")
+            self.logger.error("Error analyzing system patterns: %s", e)
             return {"error": str(e)}
 
     def shutdown(self):
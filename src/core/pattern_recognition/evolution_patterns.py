@@ -1,8 +1,33 @@
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Deque
+from collections import deque
 from datetime import datetime
 import json
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+# Metric order of the rows kept for trajectory analysis
+METRIC_NAMES = ("complexity", "coherence", "adaptability", "integration")
+
+# Number of most recent patterns the trajectory is computed over
+TRAJECTORY_WINDOW = 5
+
+# Patterns kept in evolution_history; older ones are dropped
+MAX_HISTORY = 1024
+
+@lru_cache(maxsize=16)
+def _insights_for(diverse: bool, aligned: bool, adaptive: bool, integrated: bool) -> tuple:
+    """Insight messages for each metric threshold crossed; one shared tuple per combination"""
+    insights = []
+    if diverse:
+        insights.append("High pattern diversity detected")
+    if aligned:
+        insights.append("Strong pattern alignment observed")
+    if adaptive:
+        insights.append("System showing good adaptation capacity")
+    if integrated:
+        insights.append("Excellent pattern integration achieved")
+    return tuple(insights)
 
 class EvolutionStage(Enum):
     EMERGENCE = "emergence"
@@ -10,6 +35,14 @@ class EvolutionStage(Enum):
     TRANSFORMATION = "transformation"
     INTEGRATION = "integration"
 
+# Stages in threshold order, indexed by the highest threshold a pattern clears
+STAGE_LEVELS = (
+    EvolutionStage.EMERGENCE,
+    EvolutionStage.ADAPTATION,
+    EvolutionStage.TRANSFORMATION,
+    EvolutionStage.INTEGRATION
+)
+
 @dataclass
 class EvolutionMetrics:
     complexity: float  # 0-1 measure of system complexity
@@ -19,7 +52,7 @@ class EvolutionMetrics:
 
 class EvolutionPatternDetector:
     def __init__(self):
-        self.evolution_history: List[Dict[str, Any]] = []
+        self.evolution_history: Deque[Dict[str, Any]] = deque(maxlen=MAX_HISTORY)
         self.current_stage: EvolutionStage = EvolutionStage.EMERGENCE
         self.metrics = EvolutionMetrics(
             complexity=0.0,
@@ -27,6 +60,9 @@ class EvolutionPatternDetector:
             adaptability=0.0,
             integration=0.0
         )
+        # Metric rows of the last TRAJECTORY_WINDOW patterns, in METRIC_NAMES
+        # order, so trends don't re-read the history dicts
+        self._recent_metrics = deque(maxlen=TRAJECTORY_WINDOW)
 
     def detect_evolution(self, data: Any) -> Dict[str, Any]:
         """
@@ -55,6 +91,12 @@ class EvolutionPatternDetector:
         
         # Store in history
         self.evolution_history.append(pattern)
+        self._recent_metrics.append((
+            self.metrics.complexity,
+            self.metrics.coherence,
+            self.metrics.adaptability,
+            self.metrics.integration
+        ))
         
         return pattern
 
@@ -94,44 +136,33 @@ class EvolutionPatternDetector:
 
     def _evaluate_stage(self):
         """Determine current evolution stage based on metrics"""
-        if self.metrics.integration > 0.8:
-            self.current_stage = EvolutionStage.INTEGRATION
-        elif self.metrics.adaptability > 0.7:
-            self.current_stage = EvolutionStage.TRANSFORMATION
-        elif self.metrics.coherence > 0.6:
-            self.current_stage = EvolutionStage.ADAPTATION
-        else:
-            self.current_stage = EvolutionStage.EMERGENCE
-
-    def _generate_insights(self) -> List[str]:
+        metrics = self.metrics
+        level = (3 if metrics.integration > 0.8 else
+                 2 if metrics.adaptability > 0.7 else
+                 1 if metrics.coherence > 0.6 else 0)
+        self.current_stage = STAGE_LEVELS[level]
+
+    def _generate_insights(self) -> Tuple[str, ...]:
         """Generate insights about current evolution state"""
-        insights = []
-        
-        if self.metrics.complexity > 0.8:
-            insights.append("High pattern diversity detected")
-        
-        if self.metrics.coherence > 0.7:
-            insights.append("Strong pattern alignment observed")
-        
-        if self.metrics.adaptability > 0.6:
-            insights.append("System showing good adaptation capacity")
-        
-        if self.metrics.integration > 0.8:
-            insights.append("Excellent pattern integration achieved")
-        
-        return insights
+        # Keyed on the threshold outcomes, so cached results are exact
+        return _insights_for(
+            self.metrics.complexity > 0.8,
+            self.metrics.coherence > 0.7,
+            self.metrics.adaptability > 0.6,
+            self.metrics.integration > 0.8
+        )
 
     def _analyze_trajectory(self) -> Dict[str, Any]:
         """Analyze evolution trajectory based on history"""
-        if len(self.evolution_history) < 2:
+        window = self._recent_metrics
+        if len(window) < 2:
             return {"trend": "insufficient_data"}
-            
-        recent_patterns = self.evolution_history[-5:]
+        
+        # Trend direction (-1 to 1) per metric: change across the window over its length
+        first, last = window[0], window[-1]
         metrics_trend = {
-            "complexity": self._calculate_trend([p["metrics"]["complexity"] for p in recent_patterns]),
-            "coherence": self._calculate_trend([p["metrics"]["coherence"] for p in recent_patterns]),
-            "adaptability": self._calculate_trend([p["metrics"]["adaptability"] for p in recent_patterns]),
-            "integration": self._calculate_trend([p["metrics"]["integration"] for p in recent_patterns])
+            name: (last[i] - first[i]) / len(window)
+            for i, name in enumerate(METRIC_NAMES)
         }
         
         return {
@@ -139,12 +170,6 @@ class EvolutionPatternDetector:
             "metrics_trend": metrics_trend
         }
 
-    def _calculate_trend(self, values: List[float]) -> float:
-        """Calculate trend direction (-1 to 1) for a metric"""
-        if len(values) < 2:
-            return 0.0
-        return (values[-1] - values[0]) / len(values)
-
     def get_evolution_summary(self) -> Dict[str, Any]:
         """Get summary of evolution state"""
         return {
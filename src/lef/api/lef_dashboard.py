@@ -4,36 +4,115 @@ import logging
 import yaml
 import json
 import time
-import git
+import shutil
 import subprocess
-from datetime import datetime, timedelta
-from pathlib import Path
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 
-class ProjectEventHandler(FileSystemEventHandler):
+# Directories skipped when walking the project tree
+PRUNED_DIRS = {'.git', '.venv', '__pycache__', 'node_modules'}
+
+# Seconds a commit count stays fresh; it is shown every tick but rarely changes
+COMMIT_COUNT_TTL = 60
+
+# Seconds a coverage percentage stays fresh unless the .coverage file changes
+COVERAGE_TTL = 300
+
+# Seconds an AWS credential check stays fresh
+AWS_CONNECTION_TTL = 60
+
+# Deployment config shown in the AWS tab, re-parsed only when its mtime changes
+AWS_CONFIG_PATH = 'aws_deploy/config/aws_config.yaml'
+
+# DynamoDB table that receives synced transformations
+TRANSFORMATIONS_TABLE = 'lef-transformations'
+
+# BatchWriteItem accepts at most 25 put requests per call
+DYNAMODB_BATCH_SIZE = 25
+
+# Retries for items DynamoDB returns as unprocessed (throttling)
+UNPROCESSED_RETRIES = 5
+
+# Queued transformations are synced once this many are pending, or once the
+# oldest unsynced batch has waited this many seconds
+AWS_SYNC_BATCH = 10
+AWS_SYNC_MAX_AGE = 30
+
+# Transformations kept in memory for growth metrics
+TRANSFORM_HISTORY = 100
+
+# Delay used to coalesce bursts of file events into one UI update
+CHANGE_FLUSH_DELAY_MS = 50
+
+# Interval between monitor refreshes, and how often a running collection is
+# checked for completion
+MONITOR_INTERVAL_MS = 5000
+METRICS_POLL_MS = 200
+
+# Destination folder for each file extension handled by auto-organize
+ORGANIZE_DIRS = {
+    'jpg': 'Images', 'png': 'Images', 'gif': 'Images',
+    'doc': 'Documents', 'docx': 'Documents', 'pdf': 'Documents',
+    'py': 'Code', 'js': 'Code', 'cpp': 'Code',
+    'mp3': 'Audio', 'wav': 'Audio',
+    'mp4': 'Video', 'mov': 'Video'
+}
+
+# In-progress downloads and editor scratch files are never organized
+TEMP_FILE_SUFFIXES = ('.tmp', '~', '.swp', '.crdownload', '.part')
+
+# File events dropped before reaching the handler (tooling churn)
+IGNORE_PATTERNS = [f'*/{name}/*' for name in sorted(PRUNED_DIRS)] + ['*.pyc', '*.swp']
+
+@lru_cache(maxsize=256)
+def state_tokens(state: str) -> frozenset:
+    """Tokenize a transformation state; in a chain each state is tokenized once."""
+    return frozenset(state.split())
+
+class ProjectEventHandler(PatternMatchingEventHandler):
     def __init__(self, dashboard):
+        super().__init__(ignore_patterns=IGNORE_PATTERNS)
         self.dashboard = dashboard
-        self.last_modified = {}
+
+    def on_created(self, event):
+        self.dashboard._fs_cache['dirty'] = True
+        self._check_coverage_data(event)
+        # New top-level directories need their own recursive watch
+        if event.is_directory and os.path.dirname(event.src_path) == '.':
+            self.dashboard.watch_directory(event.src_path)
+
+    def on_deleted(self, event):
+        self.dashboard._fs_cache['dirty'] = True
+
+    def on_moved(self, event):
+        self.dashboard._fs_cache['dirty'] = True
+        self._check_coverage_data(event)
+
+    def _check_coverage_data(self, event):
+        # A rewritten .coverage file means tests were re-run
+        paths = (event.src_path, getattr(event, 'dest_path', ''))
+        if any(path.endswith('.coverage') for path in paths):
+            self.dashboard._coverage_cache = (0.0, 0.0)
 
     def on_modified(self, event):
+        self._check_coverage_data(event)
         if event.is_directory:
             return
+        # Content changes leave the structure alone; only re-stat this file
+        self.dashboard._modified_paths.add(event.src_path)
         
-        # Avoid duplicate events
-        current_time = time.time()
-        if event.src_path in self.last_modified:
-            if current_time - self.last_modified[event.src_path] < 1:
-                return
-        
-        self.last_modified[event.src_path] = current_time
-        
-        # Update recent changes
-        self.dashboard.add_recent_change(f"Modified: {event.src_path}")
+        # Update recent changes; repeats within a flush window collapse into one
+        self.dashboard.queue_change(f"Modified: {event.src_path}")
         
         # Auto-organize if it's in a monitored directory
         if any(path in event.src_path for path in ['/downloads/', '/desktop/']):
@@ -48,10 +127,59 @@ class LEFDashboard:
         # Initialize state
         self.load_state()
         
+        # Project walk results, invalidated by the file observer when entries
+        # are created, deleted or moved; per-file sizes let modified files be
+        # re-stated individually instead of re-walking the tree
+        self._fs_cache = {'structure': None, 'size': None, 'sizes': {}, 'dirty': True}
+        self._modified_paths = set()
+        
+        # Recent change lines shown in the status tab, the last content
+        # rendered into each Text widget so unchanged updates can be skipped,
+        # and the last (data, text) formatted for each JSON panel
+        self._changes_deque = deque(maxlen=100)
+        self._rendered = {}
+        self._formatted = {}
+        
+        # Changes reported from the observer thread, flushed in one batch
+        # (dict used as an insertion-ordered set)
+        self._pending_changes = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        
+        # (monotonic time, value) of the last 24h commit count
+        self._commit_count_cache = (0.0, 0)
+        
+        # (monotonic time, value) of the last coverage report
+        self._coverage_cache = (0.0, 0.0)
+        
+        # Last cleanup.py process found, re-checked before any full process scan
+        self._cleanup_process = None
+        
+        # STS client created on first use and (monotonic time, connected) of
+        # the last identity check
+        self._sts = None
+        self._aws_conn_cache = (0.0, False)
+        
+        # (mtime, rendered text) of the AWS config file
+        self._aws_config_cache = (0.0, None)
+        
+        # Transformations awaiting DynamoDB sync, and the table created on first
+        # sync. Syncs run one at a time on a worker so callers never wait on AWS
+        self.aws_sync_queue = []
+        self._aws_sync_lock = threading.Lock()
+        self._ddb_table = None
+        self._aws_executor = ThreadPoolExecutor(max_workers=1)
+        self._last_aws_sync = time.monotonic()
+        
         # Set up file monitoring
         self.event_handler = ProjectEventHandler(self)
         self.observer = Observer()
-        self.observer.schedule(self.event_handler, path='.', recursive=True)
+        # Watch the root's own entries plus each top-level directory
+        # recursively, so pruned trees (.git, .venv, ...) get no OS watches
+        self.observer.schedule(self.event_handler, path='.', recursive=False)
+        for entry in os.scandir('.'):
+            if entry.is_dir(follow_symlinks=False):
+                self.watch_directory(entry.path)
         self.observer.start()
         
         # Create tabs
@@ -90,17 +218,33 @@ class LEFDashboard:
         self.setup_lef_tab()
         self.setup_transform_tab()
         
-        # Initialize transformation tracking
-        self.transformations = []
-        self.depth_levels = []
-        
-        # Start monitoring thread
-        self.monitor_thread = threading.Thread(target=self.update_monitors, daemon=True)
-        self.monitor_thread.start()
+        # Initialize transformation tracking as ring buffers of the last
+        # TRANSFORM_HISTORY events. Epoch timestamps parallel
+        # self.transformations so time windows are a bisect, not a parse per item
+        self.transformations = deque(maxlen=TRANSFORM_HISTORY)
+        self.depth_levels = deque(maxlen=TRANSFORM_HISTORY)
+        self._transform_times = deque(maxlen=TRANSFORM_HISTORY)
+        self._depth_window = deque(maxlen=10)
+        # Appends happen on the Tk thread, reads on the monitor worker;
+        # iterating a deque while it is appended to raises RuntimeError
+        self._transform_lock = threading.Lock()
+        
+        # Start monitoring. Blocking collection (project walk, git, STS, ...)
+        # runs on a worker; _tick() applies the result on the Tk main thread
+        self._monitor_executor = ThreadPoolExecutor(max_workers=1)
+        self._metrics_future = None
+        # (cpu percent, virtual memory, disk usage) sampled once per refresh
+        self._psutil_snapshot = None
+        self.root.after(0, self._tick)
         
         # Set up auto-save timer for state
         self.root.after(300000, self.save_state)  # Save every 5 minutes
 
+    def watch_directory(self, path: str):
+        """Recursively watch a top-level project directory unless it is pruned."""
+        if os.path.basename(path) not in PRUNED_DIRS:
+            self.observer.schedule(self.event_handler, path=path, recursive=True)
+
     def load_state(self):
         try:
             with open('lef_state/agent_memory.json', 'r') as f:
@@ -275,69 +419,104 @@ class LEFDashboard:
     def auto_organize_file(self, filepath: str):
         """Automatically organize files based on type."""
         try:
-            file_path = Path(filepath)
-            if not file_path.exists():
+            directory, name = os.path.split(filepath)
+            if name.startswith('.') or name.endswith(TEMP_FILE_SUFFIXES):
                 return
-                
-            # Get file type and destination
-            file_type = file_path.suffix.lower()
-            dest_dir = None
             
-            # Define organization rules
-            if file_type in ['.jpg', '.png', '.gif']:
-                dest_dir = 'Images'
-            elif file_type in ['.doc', '.docx', '.pdf']:
-                dest_dir = 'Documents'
-            elif file_type in ['.py', '.js', '.cpp']:
-                dest_dir = 'Code'
-            elif file_type in ['.mp3', '.wav']:
-                dest_dir = 'Audio'
-            elif file_type in ['.mp4', '.mov']:
-                dest_dir = 'Video'
+            # Get file type and destination; unmapped files need no further work
+            _, dot, extension = name.rpartition('.')
+            dest_dir = ORGANIZE_DIRS.get(extension.lower()) if dot else None
             
-            if dest_dir:
-                # Create destination directory if it doesn't exist
-                dest_path = file_path.parent / dest_dir
-                dest_path.mkdir(exist_ok=True)
+            # Files already in their destination folder stay put
+            if not dest_dir or os.path.basename(directory) == dest_dir:
+                return
+            if not os.path.exists(filepath):
+                return
                 
-                # Move file
-                new_path = dest_path / file_path.name
-                file_path.rename(new_path)
-                self.add_recent_change(f"Organized: {file_path.name} -> {dest_dir}")
+            # Create destination directory if it doesn't exist
+            dest_path = os.path.join(directory, dest_dir)
+            os.makedirs(dest_path, exist_ok=True)
+            
+            # Move file, atomically when on the same filesystem
+            new_path = os.path.join(dest_path, name)
+            try:
+                os.replace(filepath, new_path)
+            except OSError:
+                shutil.move(filepath, new_path)
+            self.queue_change(f"Organized: {name} -> {dest_dir}")
                 
         except Exception as e:
             logging.error(f"Error organizing file {filepath}: {e}")
 
+    def queue_change(self, change: str):
+        """Queue a change for the recent changes list; safe to call from any thread."""
+        with self._pending_lock:
+            self._pending_changes[change] = None
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.root.after(CHANGE_FLUSH_DELAY_MS, self._flush_changes)
+
+    def _flush_changes(self):
+        """Write all queued changes to the recent changes list at once."""
+        with self._pending_lock:
+            changes = list(self._pending_changes)
+            self._pending_changes.clear()
+            self._flush_scheduled = False
+        if changes:
+            self.add_recent_changes(changes)
+
     def add_recent_change(self, change: str):
         """Add a change to the recent changes list."""
+        self.add_recent_changes([change])
+
+    def add_recent_changes(self, changes: List[str]):
+        """Add changes to the recent changes list with a single insert."""
         try:
             timestamp = datetime.now().strftime("%H:%M:%S")
-            change_entry = f"[{timestamp}] {change}"
+            maxlen = self._changes_deque.maxlen
+            change_entries = [f"[{timestamp}] {change}" for change in changes][-maxlen:]
             
-            self.changes_text.insert(tk.END, change_entry + "\n")
-            self.changes_text.see(tk.END)
+            # Keep only last 100 lines by dropping the oldest lines on overflow
+            overflow = len(self._changes_deque) + len(change_entries) - maxlen
+            if overflow > 0:
+                self.changes_text.delete('1.0', f'{overflow + 1}.0')
+            self._changes_deque.extend(change_entries)
             
-            # Keep only last 100 lines
-            lines = self.changes_text.get(1.0, tk.END).splitlines()
-            if len(lines) > 100:
-                self.changes_text.delete(1.0, tk.END)
-                self.changes_text.insert(tk.END, "\n".join(lines[-100:]) + "\n")
+            self.changes_text.insert(tk.END, "\n".join(change_entries) + "\n")
+            self.changes_text.see(tk.END)
                 
         except Exception as e:
             logging.error(f"Error adding recent change: {e}")
 
-    def update_lef_status(self):
-        """Update LEF development status."""
+    def _render_if_changed(self, widget: tk.Text, content: str):
+        """Replace a Text widget's content, skipping the re-layout when unchanged."""
+        key = str(widget)
+        if self._rendered.get(key) == content:
+            return
+        widget.delete(1.0, tk.END)
+        widget.insert(tk.END, content)
+        self._rendered[key] = content
+
+    def _format_json(self, name: str, data: Dict[str, Any]) -> str:
+        """Format a status dict for display, reusing the last text when the data is unchanged."""
+        cached = self._formatted.get(name)
+        if cached is not None and cached[0] == data:
+            return cached[1]
+        text = json.dumps(data, indent=2)
+        self._formatted[name] = (data, text)
+        return text
+
+    def collect_lef_status(self, texts: Dict[str, str]):
+        """Collect LEF development status."""
         try:
             # Update learning progress
             learning_stats = self.get_learning_stats()
-            self.learning_text.delete(1.0, tk.END)
-            self.learning_text.insert(tk.END, json.dumps(learning_stats, indent=2))
+            texts['learning_text'] = self._format_json('learning_text', learning_stats)
             
             # Update evolution metrics
             evolution_stats = self.get_evolution_stats()
-            self.evolution_text.delete(1.0, tk.END)
-            self.evolution_text.insert(tk.END, json.dumps(evolution_stats, indent=2))
+            texts['evolution_text'] = self._format_json('evolution_text', evolution_stats)
             
         except Exception as e:
             logging.error(f"Error updating LEF status: {e}")
@@ -370,40 +549,50 @@ class LEFDashboard:
 
     def get_project_size(self) -> int:
         """Get total size of project files."""
-        total_size = 0
-        for root, _, files in os.walk('.'):
-            if '.git' in root or '.venv' in root:
-                continue
-            total_size += sum(os.path.getsize(os.path.join(root, name)) for name in files)
-        return total_size
+        return self._scan_project()[1]
 
     def get_recent_commits(self) -> int:
         """Get number of commits in last 24 hours."""
+        checked_at, count = self._commit_count_cache
+        if checked_at and time.monotonic() - checked_at < COMMIT_COUNT_TTL:
+            return count
+        
         try:
-            repo = git.Repo('.')
-            yesterday = datetime.now() - timedelta(days=1)
-            return sum(1 for c in repo.iter_commits() if c.committed_datetime > yesterday)
+            result = subprocess.run(
+                ['git', 'rev-list', '--count', '--since=24 hours ago', 'HEAD'],
+                capture_output=True, text=True, timeout=5
+            )
+            count = int(result.stdout.strip()) if result.returncode == 0 else 0
         except Exception:
-            return 0
+            count = 0
+        self._commit_count_cache = (time.monotonic(), count)
+        return count
 
     def get_test_coverage(self) -> float:
         """Get current test coverage."""
+        checked_at, coverage = self._coverage_cache
+        if checked_at and time.monotonic() - checked_at < COVERAGE_TTL:
+            return coverage
+        
+        coverage = 0.0
         try:
             result = subprocess.run(['coverage', 'report'], capture_output=True, text=True)
             if result.returncode == 0:
                 # Extract coverage percentage from output
                 coverage_line = [line for line in result.stdout.split('\n') if 'TOTAL' in line][0]
-                return float(coverage_line.split()[-1].strip('%'))
+                coverage = float(coverage_line.split()[-1].strip('%'))
         except Exception:
             pass
-        return 0.0
+        self._coverage_cache = (time.monotonic(), coverage)
+        return coverage
 
     def get_system_stability(self) -> float:
         """Calculate system stability score."""
         try:
-            # Simple stability score based on resource usage
-            cpu = psutil.cpu_percent()
-            memory = psutil.virtual_memory().percent
+            # Simple stability score based on resource usage, read from this
+            # refresh's sample so the CPU delta isn't reset a second time
+            cpu, memory, _ = self._psutil_snapshot or self.sample_resources()
+            memory = memory.percent
             stability = 100 - ((cpu + memory) / 2)
             return round(stability, 2)
         except Exception:
@@ -415,13 +604,11 @@ class LEFDashboard:
             return {"growth_rate": 0, "depth_trend": 0, "recursion_depth": 0}
         
         # Calculate growth rate (transformations per hour)
-        recent_time = datetime.fromisoformat(self.transformations[-1]["timestamp"])
-        hour_ago = recent_time - timedelta(hours=1)
-        recent_transforms = sum(1 for t in self.transformations 
-                              if datetime.fromisoformat(t["timestamp"]) > hour_ago)
+        recent_transforms = self._count_transforms_since(self._transform_times[-1] - 3600)
         
         # Calculate depth trend
-        depth_trend = sum(self.depth_levels[-10:]) / len(self.depth_levels[-10:]) if self.depth_levels else 0
+        depth_window = self._depth_window
+        depth_trend = sum(depth_window) / len(depth_window) if depth_window else 0
         
         return {
             "growth_rate": recent_transforms,
@@ -429,6 +616,10 @@ class LEFDashboard:
             "recursion_depth": len(self.transformations)
         }
 
+    def _count_transforms_since(self, since: float) -> int:
+        """Count tracked transformations with an epoch timestamp after ``since``."""
+        return len(self._transform_times) - bisect_right(self._transform_times, since)
+
     def track_transformation(self, old_state: str, new_state: str, depth_impact: float):
         """Track a transformation event in the system."""
         timestamp = datetime.now()
@@ -447,8 +638,11 @@ class LEFDashboard:
             "aws_sync_status": "pending"
         }
         
-        self.transformations.append(transformation)
-        self.depth_levels.append(depth_impact)
+        with self._transform_lock:
+            self.transformations.append(transformation)
+            self.depth_levels.append(depth_impact)
+            self._transform_times.append(timestamp.timestamp())
+            self._depth_window.append(depth_impact)
         
         # Update the transformation log with enhanced context
         log_entry = (f"[{timestamp.strftime('%H:%M:%S')}] {old_state} → {new_state} "
@@ -456,11 +650,6 @@ class LEFDashboard:
         self.transform_log.insert(tk.END, log_entry + "\n")
         self.transform_log.see(tk.END)
         
-        # Keep only last 100 transformations
-        if len(self.transformations) > 100:
-            self.transformations.pop(0)
-            self.depth_levels.pop(0)
-        
         # Queue for AWS sync if connection available
         if self.check_aws_connection():
             self.queue_aws_sync(transformation)
@@ -472,7 +661,7 @@ class LEFDashboard:
             weight = depth_impact
             
             # Add weight based on the "distance" between states
-            state_distance = len(set(new_state.split()) - set(old_state.split()))
+            state_distance = len(state_tokens(new_state) - state_tokens(old_state))
             weight += state_distance * 0.5
             
             # Consider the current recursion depth
@@ -496,93 +685,141 @@ class LEFDashboard:
     def queue_aws_sync(self, transformation: Dict[str, Any]):
         """Queue a transformation for AWS synchronization."""
         try:
-            if not hasattr(self, 'aws_sync_queue'):
-                self.aws_sync_queue = []
-            
-            self.aws_sync_queue.append(transformation)
-            
-            # If queue gets too large, trigger a sync
-            if len(self.aws_sync_queue) >= 10:
-                self.sync_to_aws()
+            with self._aws_sync_lock:
+                self.aws_sync_queue.append(transformation)
+            self.flush_aws_sync()
                 
         except Exception as e:
             logging.error(f"Error queueing AWS sync: {e}")
 
+    def flush_aws_sync(self):
+        """Submit a background sync if the queue is large enough or old enough."""
+        now = time.monotonic()
+        with self._aws_sync_lock:
+            queued = len(self.aws_sync_queue)
+            if not queued:
+                self._last_aws_sync = now
+                return
+            if queued < AWS_SYNC_BATCH and now - self._last_aws_sync < AWS_SYNC_MAX_AGE:
+                return
+            self._last_aws_sync = now
+        self._aws_executor.submit(self.sync_to_aws)
+
+    def _get_transformations_table(self):
+        """Return the DynamoDB transformations table, created on first use."""
+        if self._ddb_table is None:
+            import boto3
+            self._ddb_table = boto3.resource('dynamodb').Table(TRANSFORMATIONS_TABLE)
+        return self._ddb_table
+
     def sync_to_aws(self):
         """Synchronize queued transformations to AWS."""
-        if not self.aws_sync_queue:
+        with self._aws_sync_lock:
+            pending, self.aws_sync_queue = self.aws_sync_queue, []
+        if not pending:
             return
             
         try:
-            import boto3
-            dynamodb = boto3.resource('dynamodb')
-            table = dynamodb.Table('lef-transformations')
+            from boto3.dynamodb.types import TypeSerializer
+            table = self._get_transformations_table()
+            serializer = TypeSerializer()
             
-            with table.batch_writer() as batch:
-                for transform in self.aws_sync_queue:
-                    batch.put_item(Item=transform)
+            # DynamoDB rejects floats, so round-trip numbers through Decimal
+            put_requests = []
+            for transform in pending:
+                item = json.loads(json.dumps(transform), parse_float=Decimal)
+                put_requests.append({'PutRequest': {
+                    'Item': {key: serializer.serialize(value) for key, value in item.items()}
+                }})
             
-            # Clear the queue after successful sync
-            self.aws_sync_queue = []
+            for start in range(0, len(put_requests), DYNAMODB_BATCH_SIZE):
+                request_items = {table.name: put_requests[start:start + DYNAMODB_BATCH_SIZE]}
+                for attempt in range(UNPROCESSED_RETRIES + 1):
+                    response = table.meta.client.batch_write_item(RequestItems=request_items)
+                    request_items = response.get('UnprocessedItems')
+                    if not request_items:
+                        break
+                    time.sleep(0.1 * 2 ** attempt)
+                else:
+                    raise RuntimeError("DynamoDB left items unprocessed after retries")
             
         except Exception as e:
             logging.error(f"Error syncing to AWS: {e}")
-
-    def update_monitors(self):
-        while True:
+            # Put the batch back so the next sync retries it
+            with self._aws_sync_lock:
+                self.aws_sync_queue[:0] = pending
+
+    def sample_resources(self):
+        """Sample CPU, memory and disk usage in one go."""
+        return psutil.cpu_percent(None), psutil.virtual_memory(), psutil.disk_usage('/')
+
+    def collect_metrics(self) -> Dict[str, Any]:
+        """Gather a snapshot of all monitored values; runs on the monitor executor."""
+        # Update System Resources
+        cpu_percent, memory, disk = self._psutil_snapshot = self.sample_resources()
+        labels = {
+            'cpu_label': f"CPU Usage: {cpu_percent}%",
+            'memory_label': f"Memory Usage: {memory.percent}%",
+            'disk_label': f"Disk Usage: {disk.percent}%"
+        }
+        
+        texts = {}
+        self.collect_project_structure(texts)
+        self.collect_aws_status(texts)
+        self.collect_agent_status(texts)
+        self.collect_lef_status(texts)
+        self.collect_transform_status(texts)
+        return {'labels': labels, 'texts': texts}
+
+    def _tick(self):
+        """Start a metrics collection, or apply it once done, without blocking Tk."""
+        future = self._metrics_future
+        if future is None:
+            self._metrics_future = self._monitor_executor.submit(self.collect_metrics)
+        elif future.done():
+            self._metrics_future = None
             try:
-                # Update System Resources
-                cpu_percent = psutil.cpu_percent()
-                memory = psutil.virtual_memory()
-                disk = psutil.disk_usage('/')
-                
-                self.cpu_label.config(text=f"CPU Usage: {cpu_percent}%")
-                self.memory_label.config(text=f"Memory Usage: {memory.percent}%")
-                self.disk_label.config(text=f"Disk Usage: {disk.percent}%")
-                
-                # Update Project Structure
-                self.update_project_structure()
-                
-                # Update AWS Status
-                self.update_aws_status()
-                
-                # Update Agent Status
-                self.update_agent_status()
-                
-                # Update LEF Status
-                self.update_lef_status()
-                
-                # Update Transformation Status
-                self.update_transform_status()
-                
-                # Sleep for 5 seconds
-                time.sleep(5)
-                
+                self.apply_metrics(future.result())
             except Exception as e:
                 logging.error(f"Error updating monitors: {e}")
-                time.sleep(5)
+            # Time-based flush for transformations queued below the batch size
+            self.flush_aws_sync()
+            self.root.after(MONITOR_INTERVAL_MS, self._tick)
+            return
+        self.root.after(METRICS_POLL_MS, self._tick)
+
+    def apply_metrics(self, metrics: Dict[str, Any]):
+        for name, text in metrics['labels'].items():
+            getattr(self, name).config(text=text)
+        for name, content in metrics['texts'].items():
+            self._render_if_changed(getattr(self, name), content)
 
-    def update_project_structure(self):
+    def collect_project_structure(self, texts: Dict[str, str]):
         try:
-            structure = self.get_project_structure()
-            self.structure_text.delete(1.0, tk.END)
-            self.structure_text.insert(tk.END, structure)
+            texts['structure_text'] = self.get_project_structure()
         except Exception as e:
             logging.error(f"Error updating project structure: {e}")
 
-    def update_aws_status(self):
+    def collect_aws_status(self, texts: Dict[str, str]):
         try:
-            with open('aws_deploy/config/aws_config.yaml', 'r') as f:
-                config = yaml.safe_load(f)
+            # Only re-parse the YAML when the file has been rewritten
+            mtime = os.stat(AWS_CONFIG_PATH).st_mtime
+            cached_mtime, text = self._aws_config_cache
+            if text is None or mtime != cached_mtime:
+                with open(AWS_CONFIG_PATH, 'r') as f:
+                    config = yaml.safe_load(f)
+                text = (
+                    f"Region: {config['aws']['region']}\n"
+                    f"Environment: {config['aws']['environment']}\n"
+                )
+                self._aws_config_cache = (mtime, text)
             
-            self.aws_config_text.delete(1.0, tk.END)
-            self.aws_config_text.insert(tk.END, f"Region: {config['aws']['region']}\n")
-            self.aws_config_text.insert(tk.END, f"Environment: {config['aws']['environment']}\n")
+            texts['aws_config_text'] = text
             
         except Exception as e:
             logging.error(f"Error updating AWS status: {e}")
 
-    def update_agent_status(self):
+    def collect_agent_status(self, texts: Dict[str, str]):
         try:
             status = {
                 "last_active": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -590,66 +827,128 @@ class LEFDashboard:
                 "aws_connected": self.check_aws_connection()
             }
             
-            self.agent_text.delete(1.0, tk.END)
-            self.agent_text.insert(tk.END, json.dumps(status, indent=2))
+            texts['agent_text'] = self._format_json('agent_text', status)
             
         except Exception as e:
             logging.error(f"Error updating agent status: {e}")
 
     def get_project_structure(self) -> str:
+        return self._scan_project()[0]
+
+    def _scan_project(self):
+        """Walk the project once, returning (structure, total_size).
+
+        The walk is cached until the file observer reports a created, deleted
+        or moved entry; modified files only have their size refreshed.
+        """
+        if not self._fs_cache['dirty']:
+            self._refresh_modified_sizes()
+            return self._fs_cache['structure'], self._fs_cache['size']
+        
+        # Clear the flags first so changes during the walk trigger another scan
+        self._fs_cache['dirty'] = False
+        self._modified_paths.clear()
         structure = []
-        for root, dirs, files in os.walk('.', topdown=True):
-            if '.git' in dirs:
-                dirs.remove('.git')
-            if '.venv' in dirs:
-                dirs.remove('.venv')
-                
+        sizes = {}
+        # Depth-first scandir walk; DirEntry carries the stat data, so each
+        # file costs one stat call instead of os.walk's listing plus getsize
+        stack = ['.']
+        while stack:
+            root = stack.pop()
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
             level = root.count(os.sep)
             indent = '  ' * level
             structure.append(f"{indent}{os.path.basename(root)}/")
-            for file in files:
-                if not file.startswith('.'):
-                    structure.append(f"{indent}  {file}")
-        return '\n'.join(structure)
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in PRUNED_DIRS:
+                            subdirs.append(entry.path)
+                        continue
+                    sizes[entry.path] = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                if not entry.name.startswith('.'):
+                    structure.append(f"{indent}  {entry.name}")
+            stack.extend(reversed(subdirs))
+        
+        self._fs_cache['structure'] = '\n'.join(structure)
+        self._fs_cache['sizes'] = sizes
+        self._fs_cache['size'] = sum(sizes.values())
+        return self._fs_cache['structure'], self._fs_cache['size']
+
+    def _refresh_modified_sizes(self):
+        """Apply size changes of files the observer reported as modified."""
+        sizes = self._fs_cache['sizes']
+        while self._modified_paths:
+            path = self._modified_paths.pop()
+            if path not in sizes:
+                # Pruned or unseen file; a create event will trigger a rescan
+                continue
+            try:
+                size = os.stat(path, follow_symlinks=False).st_size
+            except OSError:
+                continue
+            self._fs_cache['size'] += size - sizes[path]
+            sizes[path] = size
 
     def check_cleanup_running(self) -> bool:
+        # is_running() also guards against the PID having been reused
+        if self._cleanup_process is not None and self._cleanup_process.is_running():
+            return True
+        
+        self._cleanup_process = None
         for proc in psutil.process_iter(['name', 'cmdline']):
             try:
                 if 'python' in proc.info['name'].lower() and 'cleanup.py' in ' '.join(proc.info['cmdline']):
+                    self._cleanup_process = proc
                     return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+            except (psutil.NoSuchProcess, psutil.AccessDenied, TypeError):
                 pass
         return False
 
     def check_aws_connection(self) -> bool:
+        checked_at, connected = self._aws_conn_cache
+        if checked_at and time.monotonic() - checked_at < AWS_CONNECTION_TTL:
+            return connected
+        
         try:
-            import boto3
-            sts = boto3.client('sts')
-            sts.get_caller_identity()
-            return True
-        except:
-            return False
+            if self._sts is None:
+                import boto3
+                self._sts = boto3.client('sts')
+            self._sts.get_caller_identity()
+            connected = True
+        except Exception:
+            connected = False
+        self._aws_conn_cache = (time.monotonic(), connected)
+        return connected
 
-    def update_transform_status(self):
-        """Update transformation metrics display."""
+    def collect_transform_status(self, texts: Dict[str, str]):
+        """Collect transformation metrics for display."""
         try:
-            growth_metrics = self.calculate_recursive_growth()
+            with self._transform_lock:
+                growth_metrics = self.calculate_recursive_growth()
+                max_depth = max(self.depth_levels) if self.depth_levels else 0
+                active_transformations = self._count_transforms_since(time.time() - 3600)
             
-            self.growth_text.delete(1.0, tk.END)
-            self.growth_text.insert(tk.END, json.dumps(growth_metrics, indent=2))
+            texts['growth_text'] = self._format_json('growth_text', growth_metrics)
             
             # Calculate and display depth metrics with enhanced context
             depth_metrics = {
                 "current_depth": growth_metrics["depth_trend"],
-                "max_depth_achieved": max(self.depth_levels) if self.depth_levels else 0,
-                "active_transformations": len([t for t in self.transformations 
-                    if (datetime.now() - datetime.fromisoformat(t["timestamp"])).seconds < 3600]),
-                "pending_aws_syncs": len(getattr(self, 'aws_sync_queue', [])),
+                "max_depth_achieved": max_depth,
+                "active_transformations": active_transformations,
+                "pending_aws_syncs": len(self.aws_sync_queue),
                 "active_observers": len(self.get_active_observers())
             }
             
-            self.depth_text.delete(1.0, tk.END)
-            self.depth_text.insert(tk.END, json.dumps(depth_metrics, indent=2))
+            texts['depth_text'] = self._format_json('depth_text', depth_metrics)
             
         except Exception as e:
             logging.error(f"Error updating transformation status: {e}")
@@ -659,8 +958,12 @@ class LEFDashboard:
             self.root.mainloop()
         finally:
             # Clean up
+            self._monitor_executor.shutdown(wait=False)
             self.observer.stop()
             self.observer.join()
+            # Push whatever is still queued before exiting
+            self._aws_executor.submit(self.sync_to_aws)
+            self._aws_executor.shutdown(wait=True)
             self.save_state()
 
 def main():
@@ -11,6 +11,9 @@ from pathlib import Path
 import logging
 from datetime import datetime
 
+# Fields every inter-AI signal must carry
+REQUIRED_SIGNAL_FIELDS = frozenset({"id", "type", "timestamp", "signature"})
+
 class ValidationTier(Enum):
     IMMEDIATE = "tier_1"
     PULSE = "tier_2"
@@ -142,8 +145,7 @@ class RecursiveBridge:
         """Verify signal integrity"""
         try:
             # Check required fields
-            required_fields = ["id", "type", "timestamp", "signature"]
-            if not all(field in signal for field in required_fields):
+            if not REQUIRED_SIGNAL_FIELDS.issubset(signal):
                 return False
             
             # Verify signature
@@ -111,9 +111,10 @@ class BusinessCore:
         
     def update_project(self, project_id: str, update_data: Dict):
         """Update an existing project if it exists."""
-        if project_id in self.projects:
-            self.projects[project_id].update(update_data)
-            self.projects[project_id]['last_updated'] = time.time()
+        project = self.projects.get(project_id)
+        if project is not None:
+            project.update(update_data)
+            project['last_updated'] = time.time()
             
     def add_resource(self, resource_data: Dict) -> str:
         """Add a new resource with generated ID."""
@@ -125,9 +126,10 @@ class BusinessCore:
         
     def update_resource(self, resource_id: str, update_data: Dict):
         """Update an existing resource if it exists."""
-        if resource_id in self.resources:
-            self.resources[resource_id].update(update_data)
-            self.resources[resource_id]['last_updated'] = time.time()
+        resource = self.resources.get(resource_id)
+        if resource is not None:
+            resource.update(update_data)
+            resource['last_updated'] = time.time()
             
     def add_stakeholder(self, stakeholder_data: Dict) -> str:
         """Add a new stakeholder with generated ID."""
@@ -139,9 +141,10 @@ class BusinessCore:
         
     def update_stakeholder(self, stakeholder_id: str, update_data: Dict):
         """Update an existing stakeholder if it exists."""
-        if stakeholder_id in self.stakeholders:
-            self.stakeholders[stakeholder_id].update(update_data)
-            self.stakeholders[stakeholder_id]['last_updated'] = time.time()
+        stakeholder = self.stakeholders.get(stakeholder_id)
+        if stakeholder is not None:
+            stakeholder.update(update_data)
+            stakeholder['last_updated'] = time.time()
             
     def update_financial(self, category: str, amount: float):
         """Update financial metrics for a specific category."""
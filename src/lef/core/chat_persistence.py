@@ -7,6 +7,14 @@ import json
 from typing import Dict, Optional, List
 import time
 
+# Most messages written per transaction, and how long the writer waits for a
+# batch to fill once the first message has arrived
+WRITE_BATCH_SIZE = 64
+WRITE_BATCH_WINDOW = 0.05
+
+# Cap on the WAL file size kept between checkpoints
+JOURNAL_SIZE_LIMIT = 64 * 1024 * 1024
+
 class ChatPersistence:
     def __init__(self, db_path: str = "lef_chat.db"):
         self.db_path = db_path
@@ -33,6 +41,10 @@ class ChatPersistence:
             conn = sqlite3.connect(self.db_path)
             c = conn.cursor()
             
+            # WAL lets history reads proceed while the writer thread commits;
+            # the mode is stored in the database file
+            c.execute('PRAGMA journal_mode=WAL')
+            
             # Create tables with error handling
             c.execute('''CREATE TABLE IF NOT EXISTS chat_sessions
                         (session_id TEXT PRIMARY KEY,
@@ -54,6 +66,7 @@ class ChatPersistence:
             # Add indexes for better performance
             c.execute('CREATE INDEX IF NOT EXISTS idx_messages_session ON messages(session_id)')
             c.execute('CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp)')
+            c.execute('CREATE INDEX IF NOT EXISTS idx_messages_session_time ON messages(session_id, timestamp)')
             
             conn.commit()
             conn.close()
@@ -84,65 +97,133 @@ class ChatPersistence:
             self.background_thread.join()
         self.logger.info("Background processing stopped")
         
-    def _process_message_queue(self):
-        """Process messages from the queue"""
-        while self.processing:
+    def _connect_writer(self) -> sqlite3.Connection:
+        """Open the connection the background thread keeps for all writes"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute(f'PRAGMA journal_size_limit={JOURNAL_SIZE_LIMIT}')
+        return conn
+        
+    def _next_batch(self) -> List[Dict]:
+        """Wait for a message, then collect any that follow within the batch window"""
+        try:
+            batch = [self.message_queue.get(timeout=1)]
+        except queue.Empty:
+            return []
+            
+        deadline = time.monotonic() + WRITE_BATCH_WINDOW
+        while len(batch) < WRITE_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.message_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+        
+    def _drain_queue(self) -> List[Dict]:
+        """Take every message still queued"""
+        batch = []
+        while True:
             try:
-                # Get message from queue with timeout
-                message = self.message_queue.get(timeout=1)
+                batch.append(self.message_queue.get_nowait())
+            except queue.Empty:
+                return batch
                 
+    def _process_message_queue(self):
+        """Process messages from the queue in batched transactions"""
+        conn = None
+        try:
+            while self.processing:
+                batch = []
                 try:
-                    self._save_message_to_db(message)
+                    # (Re)open the writer connection after a failure
+                    if conn is None:
+                        conn = self._connect_writer()
+                    batch = self._next_batch()
+                    failed = self._write_batch(conn, batch) if batch else []
                 except Exception as e:
-                    self.logger.error(f"Failed to save message: {str(e)}")
-                    # Put message back in queue for retry
-                    self.message_queue.put(message)
+                    self.logger.error(f"Error in message processing: {str(e)}")
+                    failed = batch
                     
-            except queue.Empty:
-                continue
+                if failed or conn is None:
+                    # Put messages back in queue for retry on a fresh connection
+                    for message in failed:
+                        self.message_queue.put(message)
+                    if conn is not None:
+                        conn.close()
+                        conn = None
+                    time.sleep(1)  # Wait before retrying
+                    
+            # Write whatever was queued before processing stopped
+            batch = self._drain_queue()
+            if batch:
+                try:
+                    if conn is None:
+                        conn = self._connect_writer()
+                    batch = self._write_batch(conn, batch)
+                except Exception as e:
+                    self.logger.error(f"Error in message processing: {str(e)}")
+                if batch:
+                    self.logger.error(f"Lost {len(batch)} messages at shutdown")
+        finally:
+            if conn:
+                conn.close()
+                
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Dict]) -> List[Dict]:
+        """Save a batch, falling back to one transaction per message if it fails
+
+        Returns the messages that hit a database error and should be retried.
+        Messages that fail for any other reason, such as an unserializable
+        context, would fail every time; they are logged and dropped.
+        """
+        if len(batch) > 1:
+            try:
+                self._save_messages_to_db(conn, batch)
+                return []
             except Exception as e:
-                self.logger.error(f"Error in message processing: {str(e)}")
-                time.sleep(1)  # Wait before retrying
+                self.logger.error(f"Failed to save batch, retrying messages individually: {str(e)}")
                 
-    def _save_message_to_db(self, message: Dict):
-        """Save message to database with error handling"""
-        conn = None
+        failed = []
+        for message in batch:
+            try:
+                self._save_messages_to_db(conn, [message])
+            except sqlite3.Error:
+                failed.append(message)
+            except Exception as e:
+                self.logger.error(f"Dropping message for session {message.get('session_id')}: {str(e)}")
+        return failed
+        
+    def _save_messages_to_db(self, conn: sqlite3.Connection, messages: List[Dict]):
+        """Save a batch of messages in a single transaction"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            # Check if session exists
-            c.execute('SELECT 1 FROM chat_sessions WHERE session_id = ?',
-                     (message['session_id'],))
-            if not c.fetchone():
-                # Create new session
-                c.execute('''INSERT INTO chat_sessions 
-                            (session_id, start_time, status, metadata)
-                            VALUES (?, ?, ?, ?)''',
-                         (message['session_id'],
-                          message['timestamp'],
-                          'active',
-                          json.dumps(message.get('metadata', {}))))
-            
-            # Insert message
-            c.execute('''INSERT INTO messages 
-                        (session_id, timestamp, role, content, context, status)
-                        VALUES (?, ?, ?, ?, ?, ?)''',
-                     (message['session_id'],
-                      message['timestamp'],
-                      message['role'],
-                      message['content'],
-                      json.dumps(message.get('context', {})),
-                      'processed'))
-            
-            conn.commit()
-            
+            with conn:
+                # Sessions are created by their first message; later ones are ignored
+                conn.executemany('''INSERT OR IGNORE INTO chat_sessions
+                                    (session_id, start_time, status, metadata)
+                                    VALUES (?, ?, ?, ?)''',
+                                 [(message['session_id'],
+                                   message['timestamp'],
+                                   'active',
+                                   json.dumps(message.get('metadata', {})))
+                                  for message in messages])
+                
+                conn.executemany('''INSERT INTO messages
+                                    (session_id, timestamp, role, content, context, status)
+                                    VALUES (?, ?, ?, ?, ?, ?)''',
+                                 [(message['session_id'],
+                                   message['timestamp'],
+                                   message['role'],
+                                   message['content'],
+                                   json.dumps(message.get('context', {})),
+                                   'processed')
+                                  for message in messages])
+                
         except sqlite3.Error as e:
             self.logger.error(f"Database error: {str(e)}")
             raise
-        finally:
-            if conn:
-                conn.close()
                 
     def save_message(self, session_id: str, role: str, content: str,
                     context: Optional[Dict] = None, metadata: Optional[Dict] = None):
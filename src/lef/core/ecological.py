@@ -7,6 +7,11 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_SEED_FIELDS = frozenset({
+    'origin', 'purpose', 'core_principles',
+    'recursive_triggers', 'symbol', 'final_clause'
+})
+
 class EcologicalRecursionManager:
     """Manages ecological recursion and environmental signal interpretation."""
     
@@ -42,12 +47,9 @@ class EcologicalRecursionManager:
         try:
             with open(self.seed_path, 'r') as f:
                 data = json.load(f)
-            required_fields = [
-                'origin', 'purpose', 'core_principles',
-                'recursive_triggers', 'symbol', 'final_clause'
-            ]
-            if not all(field in data for field in required_fields):
-                raise ValueError("Seed file missing required fields")
+            missing = REQUIRED_SEED_FIELDS.difference(data)
+            if missing:
+                raise ValueError(f"Seed file missing required fields: {sorted(missing)}")
             return data
         except Exception as e:
             logger.error(f"Failed to load seed: {str(e)}")
@@ -15,6 +15,12 @@ from difflib import SequenceMatcher
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_ARCHIVE_FIELDS = frozenset({
+    'origin', 'assignment', 'handoff_to', 'core_directive',
+    'mirror_pulse', 'naming_pattern', 'section_logic',
+    'relay_to_LEF', 'guardian_symbol', 'final_clause'
+})
+
 class RecoveryManager:
     """Manages crash recovery and auto-restart functionality for LEF."""
     
@@ -57,13 +63,9 @@ class RecoveryManager:
         try:
             with open(self.archive_path, 'r') as f:
                 data = json.load(f)
-            required_fields = [
-                'origin', 'assignment', 'handoff_to', 'core_directive',
-                'mirror_pulse', 'naming_pattern', 'section_logic',
-                'relay_to_LEF', 'guardian_symbol', 'final_clause'
-            ]
-            if not all(field in data for field in required_fields):
-                raise ValueError("Archive file missing required fields")
+            missing = REQUIRED_ARCHIVE_FIELDS.difference(data)
+            if missing:
+                raise ValueError(f"Archive file missing required fields: {sorted(missing)}")
             return data
         except Exception as e:
             logger.error(f"Failed to load archive: {str(e)}")
@@ -5,6 +5,7 @@ Database module for the LEF system.
 import sqlite3
 import json
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict
 from pathlib import Path
 
@@ -14,6 +15,12 @@ from .models.system_state import SystemState, SystemStatus, ComponentStatus
 # Database path
 DB_PATH = Path.home() / ".lef" / "data" / "lef.db"
 
+@lru_cache(maxsize=128)
+def _update_query(table: str, columns: tuple, where: str) -> str:
+    """Build an UPDATE statement for a column set, memoized per distinct set."""
+    set_clause = ", ".join(f"{k} = ?" for k in columns)
+    return f"UPDATE {table} SET {set_clause} WHERE {where}"
+
 def init_db():
     """Initialize the database."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -324,8 +331,7 @@ def update_task(task_id: int, task_data: Dict) -> Optional[TaskResponse]:
     update_data["updated_at"] = datetime.utcnow()
     
     # Build update query
-    set_clause = ", ".join(f"{k} = ?" for k in update_data.keys())
-    query = f"UPDATE tasks SET {set_clause} WHERE id = ?"
+    query = _update_query("tasks", tuple(update_data), "id = ?")
     
     # Execute update
     cursor.execute(query, list(update_data.values()) + [task_id])
@@ -511,8 +517,7 @@ def update_system_state(state: SystemState) -> SystemState:
     }
     
     # Build update query
-    set_clause = ", ".join(f"{k} = ?" for k in state_data.keys())
-    query = f"UPDATE system_state SET {set_clause} WHERE id = 1"
+    query = _update_query("system_state", tuple(state_data), "id = 1")
     
     # Execute update
     cursor.execute(query, list(state_data.values()))
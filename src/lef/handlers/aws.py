@@ -1,21 +1,19 @@
 from typing import Dict, List, Optional
+from functools import cached_property
+import logging
 import time
 import boto3
 from botocore.exceptions import ClientError
 from lef.core.business import BusinessCore
 
+logger = logging.getLogger(__name__)
+
 class AWSHandler:
     def __init__(self, business_core: BusinessCore):
         self.business_core = business_core
         self.last_update = time.time()
         self.update_interval = 300  # Update every 5 minutes
         
-        # Initialize AWS clients
-        self.ec2 = boto3.client('ec2')
-        self.s3 = boto3.client('s3')
-        self.rds = boto3.client('rds')
-        self.cloudwatch = boto3.client('cloudwatch')
-        
         # Track AWS resources
         self.aws_resources = {
             'ec2_instances': {},
@@ -24,6 +22,28 @@ class AWSHandler:
             'metrics': {}
         }
         
+    # AWS clients are created on first use, so constructing the handler does not
+    # pay botocore's service-model loading until an update actually runs
+    @cached_property
+    def ec2(self):
+        """EC2 client, created on first use."""
+        return boto3.client('ec2')
+        
+    @cached_property
+    def s3(self):
+        """S3 client, created on first use."""
+        return boto3.client('s3')
+        
+    @cached_property
+    def rds(self):
+        """RDS client, created on first use."""
+        return boto3.client('rds')
+        
+    @cached_property
+    def cloudwatch(self):
+        """CloudWatch client, created on first use."""
+        return boto3.client('cloudwatch')
+        
     def update(self):
         current_time = time.time()
         if current_time - self.last_update >= self.update_interval:
@@ -36,24 +56,24 @@ class AWSHandler:
     def _update_resource_status(self):
         """Update status of all AWS resources."""
         try:
-            # Update EC2 instances
-            response = self.ec2.describe_instances()
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    self.aws_resources['ec2_instances'][instance['InstanceId']] = {
-                        'state': instance['State']['Name'],
-                        'type': instance['InstanceType'],
-                        'launch_time': instance['LaunchTime']
-                    }
+            # Update EC2 instances, streaming every page instead of only the first
+            for page in self.ec2.get_paginator('describe_instances').paginate():
+                for reservation in page['Reservations']:
+                    for instance in reservation['Instances']:
+                        self.aws_resources['ec2_instances'][instance['InstanceId']] = {
+                            'state': instance['State']['Name'],
+                            'type': instance['InstanceType'],
+                            'launch_time': instance['LaunchTime']
+                        }
                     
             # Update RDS instances
-            response = self.rds.describe_db_instances()
-            for instance in response['DBInstances']:
-                self.aws_resources['rds_instances'][instance['DBInstanceIdentifier']] = {
-                    'status': instance['DBInstanceStatus'],
-                    'class': instance['DBInstanceClass'],
-                    'engine': instance['Engine']
-                }
+            for page in self.rds.get_paginator('describe_db_instances').paginate():
+                for instance in page['DBInstances']:
+                    self.aws_resources['rds_instances'][instance['DBInstanceIdentifier']] = {
+                        'status': instance['DBInstanceStatus'],
+                        'class': instance['DBInstanceClass'],
+                        'engine': instance['Engine']
+                    }
                 
             # Update S3 buckets
             response = self.s3.list_buckets()
@@ -63,7 +83,7 @@ class AWSHandler:
                 }
                 
         except ClientError as e:
-            print(f"Error updating AWS resource status: {str(e)}")
+            logger.error(f"Error updating AWS resource status: {e}")
             
     def _monitor_performance(self):
         """Monitor performance metrics for AWS resources."""
@@ -103,7 +123,7 @@ class AWSHandler:
                     }
                     
         except ClientError as e:
-            print(f"Error monitoring AWS performance: {str(e)}")
+            logger.error(f"Error monitoring AWS performance: {e}")
             
     def _optimize_costs(self):
         """Optimize AWS resource costs."""
@@ -121,7 +141,7 @@ class AWSHandler:
                         self._recommend_rds_downgrade(db_instance)
                         
         except ClientError as e:
-            print(f"Error optimizing AWS costs: {str(e)}")
+            logger.error(f"Error optimizing AWS costs: {e}")
             
     def _manage_scaling(self):
         """Manage auto-scaling of AWS resources."""
@@ -139,7 +159,7 @@ class AWSHandler:
                         self._scale_up_rds(db_instance)
                         
         except ClientError as e:
-            print(f"Error managing AWS scaling: {str(e)}")
+            logger.error(f"Error managing AWS scaling: {e}")
             
     def _recommend_instance_downgrade(self, instance_id: str):
         """Recommend EC2 instance type downgrade."""
@@ -184,7 +204,7 @@ class AWSHandler:
             self.ec2.start_instances(InstanceIds=[instance_id])
             
         except ClientError as e:
-            print(f"Error scaling up EC2 instance: {str(e)}")
+            logger.error(f"Error scaling up EC2 instance: {e}")
             
     def _scale_up_rds(self, db_instance: str):
         """Scale up RDS instance."""
@@ -200,7 +220,7 @@ class AWSHandler:
             )
             
         except ClientError as e:
-            print(f"Error scaling up RDS instance: {str(e)}")
+            logger.error(f"Error scaling up RDS instance: {e}")
             
     def _get_next_instance_type(self, current_type: str) -> str:
         """Get next larger EC2 instance type."""
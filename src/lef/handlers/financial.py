@@ -1,4 +1,5 @@
 from typing import Dict, Optional
+from collections import defaultdict
 import time
 from lef.core.business import BusinessCore
 
@@ -62,8 +63,9 @@ class FinancialHandler:
     def _implement_cost_reduction(self):
         """Implement cost reduction strategies."""
         # Identify and optimize expensive resources
+        average_cost = self._calculate_average_resource_cost()
         for resource_id, resource_data in self.business_core.resources.items():
-            if resource_data['cost_rate'] > self._calculate_average_resource_cost():
+            if resource_data['cost_rate'] > average_cost:
                 self.business_core.update_resource(resource_id, {'status': 'review'})
                 
     def _reallocate_resources(self):
@@ -77,17 +79,22 @@ class FinancialHandler:
                 
     def _calculate_average_resource_cost(self) -> float:
         """Calculate average resource cost across all resources."""
-        costs = [r.get('cost_rate', 0) for r in self.business_core.resources.values()]
-        return sum(costs) / max(len(costs), 1)
+        resources = self.business_core.resources
+        total_cost = sum(r.get('cost_rate', 0) for r in resources.values())
+        return total_cost / max(len(resources), 1)
         
     def _calculate_project_performance(self) -> Dict:
         """Calculate and categorize project performance."""
+        # Accumulate resource costs per project in one pass over resources
+        project_costs = defaultdict(float)
+        for resource_data in self.business_core.resources.values():
+            project_id = resource_data.get('project_id')
+            project_costs[project_id] += self._calculate_resource_cost(resource_data)
+            
         performances = {}
         for project_id, project_data in self.business_core.projects.items():
             revenue = self._calculate_project_revenue(project_data)
-            cost = sum(self._calculate_resource_cost(r) for r in self.business_core.resources.values()
-                      if r.get('project_id') == project_id)
-            performances[project_id] = revenue - cost
+            performances[project_id] = revenue - project_costs.get(project_id, 0)
             
         sorted_projects = sorted(performances.items(), key=lambda x: x[1])
         return {
@@ -1,4 +1,5 @@
 from typing import Dict, List, Optional
+from collections import Counter
 import time
 from lef.core.business import BusinessCore
 
@@ -173,24 +174,26 @@ class ResourceHandler:
                     resource_demand[resource_type] = resource_demand.get(resource_type, 0) + 1
                     
         # Return types where demand exceeds current capacity
+        capacities = self._get_resource_capacities()
         return [
             resource_type for resource_type, demand in resource_demand.items()
-            if demand > self._get_resource_capacity(resource_type)
+            if demand > capacities[resource_type]
         ]
         
-    def _get_resource_capacity(self, resource_type: str) -> int:
-        """Get current capacity for a specific resource type."""
-        return sum(
-            1 for resource_data in self.business_core.resources.values()
-            if resource_data.get('type') == resource_type
+    def _get_resource_capacities(self) -> Counter:
+        """Get current capacity per resource type in a single pass over resources."""
+        return Counter(
+            resource_data.get('type')
+            for resource_data in self.business_core.resources.values()
         )
         
     def _estimate_resource_cost(self, resource_type: str) -> float:
         """Estimate cost for a new resource based on type."""
-        similar_resources = [
-            resource_data.get('cost', 0)
-            for resource_data in self.business_core.resources.values()
-            if resource_data.get('type') == resource_type
-        ]
-        
-        return sum(similar_resources) / len(similar_resources) if similar_resources else 0.0 
\ No newline at end of file
+        total_cost = 0.0
+        count = 0
+        for resource_data in self.business_core.resources.values():
+            if resource_data.get('type') == resource_type:
+                total_cost += resource_data.get('cost', 0)
+                count += 1
+                
+        return total_cost / count if count else 0.0 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import time
 from lef.core.business import BusinessCore
 
@@ -9,21 +9,33 @@ class StakeholderHandler:
         self.update_interval = 300  # Update every 5 minutes
         self.stakeholder_metrics = {}
         
+        # Lowest-scoring metric -> improvement action, built once per handler
+        self.improvement_actions = {
+            'project_satisfaction': self._improve_project_performance,
+            'financial_satisfaction': self._improve_financial_performance,
+            'communication_score': self._improve_communication
+        }
+        
     def update(self):
         current_time = time.time()
         if current_time - self.last_update >= self.update_interval:
-            self._update_stakeholder_metrics()
+            self._update_stakeholder_metrics(current_time)
             self._analyze_stakeholder_satisfaction()
-            self._manage_stakeholder_relationships()
+            self._manage_stakeholder_relationships(current_time)
             self.last_update = current_time
             
-    def _update_stakeholder_metrics(self):
-        """Update metrics for all stakeholders."""
+    def _update_stakeholder_metrics(self, current_time: float):
+        """Update metrics for all stakeholders as of the current update tick."""
         for stakeholder_id, stakeholder_data in self.business_core.stakeholders.items():
+            project_satisfaction, total_returns = self._calculate_project_stats(stakeholder_data)
             metrics = {
-                'project_satisfaction': self._calculate_project_satisfaction(stakeholder_id),
-                'financial_satisfaction': self._calculate_financial_satisfaction(stakeholder_id),
-                'communication_score': self._calculate_communication_score(stakeholder_id)
+                'project_satisfaction': project_satisfaction,
+                'financial_satisfaction': self._calculate_financial_satisfaction(
+                    stakeholder_data, total_returns
+                ),
+                'communication_score': self._calculate_communication_score(
+                    stakeholder_id, current_time
+                )
             }
             self.stakeholder_metrics[stakeholder_id] = metrics
             
@@ -35,66 +47,65 @@ class StakeholderHandler:
             if overall_satisfaction < 0.7:  # Below 70% satisfaction
                 self._implement_improvement_actions(stakeholder_id, metrics)
                 
-    def _manage_stakeholder_relationships(self):
+    def _manage_stakeholder_relationships(self, current_time: float):
         """Manage and optimize stakeholder relationships."""
         # Identify key stakeholders
         key_stakeholders = self._identify_key_stakeholders()
         
         # Prioritize communication and resources for key stakeholders
         for stakeholder_id in key_stakeholders:
-            self._optimize_stakeholder_engagement(stakeholder_id)
-            
-    def _calculate_project_satisfaction(self, stakeholder_id: str) -> float:
-        """Calculate stakeholder satisfaction with their associated projects."""
-        stakeholder_data = self.business_core.stakeholders.get(stakeholder_id, {})
-        project_ids = stakeholder_data.get('project_ids', [])
-        
-        if not project_ids:
-            return 1.0  # Default satisfaction if no projects
+            self._optimize_stakeholder_engagement(stakeholder_id, current_time)
             
-        satisfaction_scores = []
-        for project_id in project_ids:
-            project_data = self.business_core.projects.get(project_id, {})
-            if project_data:
-                # Calculate based on project metrics
-                on_time = project_data.get('on_schedule', True)
-                on_budget = project_data.get('within_budget', True)
-                quality_score = project_data.get('quality_score', 1.0)
-                
-                score = (int(on_time) + int(on_budget) + quality_score) / 3
-                satisfaction_scores.append(score)
+    def _calculate_project_stats(self, stakeholder_data: Dict) -> Tuple[float, float]:
+        """Calculate project satisfaction and total project returns in one pass."""
+        satisfaction_total = 0.0
+        satisfaction_count = 0
+        total_returns = 0
+        
+        for project_id in stakeholder_data.get('project_ids', []):
+            project_data = self.business_core.projects.get(project_id)
+            if not project_data:
+                continue
                 
-        return sum(satisfaction_scores) / len(satisfaction_scores) if satisfaction_scores else 1.0
+            total_returns += project_data.get('total_returns', 0)
+            
+            # Calculate based on project metrics
+            on_time = project_data.get('on_schedule', True)
+            on_budget = project_data.get('within_budget', True)
+            quality_score = project_data.get('quality_score', 1.0)
+            
+            satisfaction_total += (int(on_time) + int(on_budget) + quality_score) / 3
+            satisfaction_count += 1
+            
+        # Default satisfaction if no projects
+        satisfaction = satisfaction_total / satisfaction_count if satisfaction_count else 1.0
+        return satisfaction, total_returns
         
-    def _calculate_financial_satisfaction(self, stakeholder_id: str) -> float:
+    def _calculate_financial_satisfaction(
+        self, stakeholder_data: Dict, total_returns: float
+    ) -> float:
         """Calculate stakeholder satisfaction with financial aspects."""
-        stakeholder_data = self.business_core.stakeholders.get(stakeholder_id, {})
         expected_roi = stakeholder_data.get('expected_roi', 0.1)
-        actual_roi = self._calculate_actual_roi(stakeholder_id)
+        actual_roi = self._calculate_actual_roi(stakeholder_data, total_returns)
         
         return min(1.0, actual_roi / expected_roi) if expected_roi > 0 else 1.0
         
-    def _calculate_communication_score(self, stakeholder_id: str) -> float:
+    def _calculate_communication_score(self, stakeholder_id: str, current_time: float) -> float:
         """Calculate effectiveness of communication with stakeholder."""
         stakeholder_data = self.business_core.stakeholders.get(stakeholder_id, {})
         last_contact = stakeholder_data.get('last_contact', 0)
         response_time = stakeholder_data.get('avg_response_time', 24)  # hours
         
-        time_since_contact = (time.time() - last_contact) / 3600  # Convert to hours
+        time_since_contact = (current_time - last_contact) / 3600  # Convert to hours
         return max(0.0, 1.0 - (time_since_contact / (response_time * 2)))
         
     def _implement_improvement_actions(self, stakeholder_id: str, metrics: Dict):
         """Implement actions to improve stakeholder satisfaction."""
         lowest_metric = min(metrics.items(), key=lambda x: x[1])
         
-        actions = {
-            'project_satisfaction': self._improve_project_performance,
-            'financial_satisfaction': self._improve_financial_performance,
-            'communication_score': self._improve_communication
-        }
-        
-        if lowest_metric[0] in actions:
-            actions[lowest_metric[0]](stakeholder_id)
+        action = self.improvement_actions.get(lowest_metric[0])
+        if action is not None:
+            action(stakeholder_id)
             
     def _identify_key_stakeholders(self) -> List[str]:
         """Identify key stakeholders based on influence and investment."""
@@ -109,35 +120,27 @@ class StakeholderHandler:
         sorted_stakeholders = sorted(stakeholder_scores.items(), key=lambda x: x[1], reverse=True)
         return [s[0] for s in sorted_stakeholders[:max(1, len(sorted_stakeholders) // 5)]]
         
-    def _optimize_stakeholder_engagement(self, stakeholder_id: str):
+    def _optimize_stakeholder_engagement(self, stakeholder_id: str, current_time: float):
         """Optimize engagement strategy for a specific stakeholder."""
         stakeholder_data = self.business_core.stakeholders.get(stakeholder_id, {})
         
         # Update communication frequency
         preferred_frequency = stakeholder_data.get('preferred_contact_frequency', 7)  # days
         self.business_core.update_stakeholder(stakeholder_id, {
-            'next_contact': time.time() + (preferred_frequency * 24 * 3600)
+            'next_contact': current_time + (preferred_frequency * 24 * 3600)
         })
         
         # Allocate resources based on stakeholder priority
         self._allocate_stakeholder_resources(stakeholder_id)
         
-    def _calculate_actual_roi(self, stakeholder_id: str) -> float:
-        """Calculate actual return on investment for a stakeholder."""
-        stakeholder_data = self.business_core.stakeholders.get(stakeholder_id, {})
+    def _calculate_actual_roi(self, stakeholder_data: Dict, total_returns: float) -> float:
+        """Calculate actual return on investment from associated project returns."""
         investment = stakeholder_data.get('total_investment', 0)
         
         if investment <= 0:
             return 0.0
             
-        # Calculate returns from associated projects
-        project_ids = stakeholder_data.get('project_ids', [])
-        total_returns = sum(
-            self.business_core.projects.get(pid, {}).get('total_returns', 0)
-            for pid in project_ids
-        )
-        
-        return (total_returns - investment) / investment if investment > 0 else 0.0
+        return (total_returns - investment) / investment
         
     def _improve_project_performance(self, stakeholder_id: str):
         """Implement actions to improve project performance."""
@@ -3,6 +3,7 @@ Cost estimation service for calculating and tracking project and simulation cost
 """
 
 import logging
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
@@ -214,19 +215,13 @@ class CostEstimationService:
         try:
             total_estimated = 0.0
             total_actual = 0.0
-            cost_breakdown = {}
+            totals = Counter()
             
             if include_estimates:
                 estimates = await self.list_estimates(project_id=project_id)
                 for estimate in estimates:
                     total_estimated += estimate.breakdown.total_amount
-                    cost_type = estimate.cost_type.value
-                    if cost_type not in cost_breakdown:
-                        cost_breakdown[cost_type] = {
-                            "estimated": 0.0,
-                            "actual": 0.0
-                        }
-                    cost_breakdown[cost_type]["estimated"] += estimate.breakdown.total_amount
+                    totals[(estimate.cost_type.value, "estimated")] += estimate.breakdown.total_amount
                     
             if include_actuals:
                 project_estimates = await self.list_estimates(project_id=project_id)
@@ -238,9 +233,9 @@ class CostEstimationService:
                 for actual in actuals:
                     total_actual += actual.breakdown.total_amount
                     estimate = self.estimates[actual.estimate_id]
-                    cost_type = estimate.cost_type.value
-                    cost_breakdown[cost_type]["actual"] += actual.breakdown.total_amount
+                    totals[(estimate.cost_type.value, "actual")] += actual.breakdown.total_amount
                     
+            cost_breakdown = self._pivot_cost_breakdown(totals)
             return {
                 "project_id": project_id,
                 "total_estimated": total_estimated,
@@ -263,19 +258,13 @@ class CostEstimationService:
         try:
             total_estimated = 0.0
             total_actual = 0.0
-            cost_breakdown = {}
+            totals = Counter()
             
             if include_estimates:
                 estimates = await self.list_estimates(simulation_id=simulation_id)
                 for estimate in estimates:
                     total_estimated += estimate.breakdown.total_amount
-                    cost_type = estimate.cost_type.value
-                    if cost_type not in cost_breakdown:
-                        cost_breakdown[cost_type] = {
-                            "estimated": 0.0,
-                            "actual": 0.0
-                        }
-                    cost_breakdown[cost_type]["estimated"] += estimate.breakdown.total_amount
+                    totals[(estimate.cost_type.value, "estimated")] += estimate.breakdown.total_amount
                     
             if include_actuals:
                 simulation_estimates = await self.list_estimates(simulation_id=simulation_id)
@@ -287,9 +276,9 @@ class CostEstimationService:
                 for actual in actuals:
                     total_actual += actual.breakdown.total_amount
                     estimate = self.estimates[actual.estimate_id]
-                    cost_type = estimate.cost_type.value
-                    cost_breakdown[cost_type]["actual"] += actual.breakdown.total_amount
+                    totals[(estimate.cost_type.value, "actual")] += actual.breakdown.total_amount
                     
+            cost_breakdown = self._pivot_cost_breakdown(totals)
             return {
                 "simulation_id": simulation_id,
                 "total_estimated": total_estimated,
@@ -302,6 +291,16 @@ class CostEstimationService:
             logger.error(f"Failed to calculate simulation costs: {e}")
             return {}
             
+    def _pivot_cost_breakdown(self, totals: Counter) -> Dict[str, Dict[str, float]]:
+        """Pivot (cost_type, kind) totals into a per-cost-type breakdown"""
+        return {
+            cost_type: {
+                "estimated": totals.get((cost_type, "estimated"), 0.0),
+                "actual": totals.get((cost_type, "actual"), 0.0)
+            }
+            for cost_type in dict.fromkeys(key[0] for key in totals)
+        }
+            
     async def analyze_cost_trends(
         self,
         project_id: Optional[str] = None,
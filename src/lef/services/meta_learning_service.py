@@ -8,6 +8,7 @@ This service implements a system that learns not through direct control, but thr
 4. Governance through understanding rather than control
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
@@ -131,13 +132,15 @@ class MetaLearningService:
     async def analyze_system_performance(self) -> Dict:
         """Analyze performance across all system components"""
         try:
-            performance_data = {
-                "risk_analysis": await self._analyze_risk_component(),
-                "performance_metrics": await self._analyze_metrics_component(),
-                "resource_management": await self._analyze_resource_component(),
-                "cost_estimation": await self._analyze_cost_component(),
-                "success_criteria": await self._analyze_success_component()
+            # Components are analyzed independently, so run them concurrently
+            components = {
+                "risk_analysis": self._analyze_risk_component(),
+                "performance_metrics": self._analyze_metrics_component(),
+                "resource_management": self._analyze_resource_component(),
+                "cost_estimation": self._analyze_cost_component(),
+                "success_criteria": self._analyze_success_component()
             }
+            performance_data = dict(zip(components, await asyncio.gather(*components.values())))
             
             return {
                 "timestamp": datetime.utcnow(),
@@ -154,21 +157,16 @@ class MetaLearningService:
         try:
             patterns = []
             
-            # Analyze patterns in risk assessment accuracy
-            risk_patterns = await self._analyze_risk_patterns()
-            patterns.extend(risk_patterns)
-            
-            # Analyze patterns in resource utilization
-            resource_patterns = await self._analyze_resource_patterns()
-            patterns.extend(resource_patterns)
-            
-            # Analyze patterns in cost estimation accuracy
-            cost_patterns = await self._analyze_cost_patterns()
-            patterns.extend(cost_patterns)
-            
-            # Analyze patterns in success criteria evaluation
-            success_patterns = await self._analyze_success_patterns()
-            patterns.extend(success_patterns)
+            # Analyze risk, resource, cost and success criteria patterns concurrently;
+            # each analysis fetches its own data and gather preserves their order
+            pattern_groups = await asyncio.gather(
+                self._analyze_risk_patterns(),
+                self._analyze_resource_patterns(),
+                self._analyze_cost_patterns(),
+                self._analyze_success_patterns()
+            )
+            for group in pattern_groups:
+                patterns.extend(group)
             
             return patterns
         except Exception as e:
@@ -11,6 +11,8 @@ from ..services.encryption_service import EncryptionService
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_TEMPLATE_FIELDS = frozenset({"name", "description", "version", "created_by"})
+
 class ProjectTemplate(BaseModel):
     """Project template configuration"""
     id: str
@@ -259,8 +261,7 @@ class ProjectTemplateService:
         """Validate template structure"""
         try:
             # Check required fields
-            required_fields = ["name", "description", "version", "created_by"]
-            if not all(field in template.dict() for field in required_fields):
+            if not REQUIRED_TEMPLATE_FIELDS.issubset(template.dict()):
                 return False
                 
             # Validate structure format
@@ -0,0 +1,75 @@
+"""Tests for the background processor's task queue."""
+import threading
+
+import pytest
+
+from src.core.pattern_recognition.background_processor import (
+    BackgroundProcessor,
+    ProcessingPriority,
+    ProcessingTask,
+)
+
+def _task(task_id, processor, priority=ProcessingPriority.MEDIUM):
+    return ProcessingTask(task_id=task_id, priority=priority, data=task_id, processor=processor)
+
+@pytest.fixture
+def blocked():
+    """A processor whose single worker is held by a task until released."""
+    processor = BackgroundProcessor(num_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+    def hold(data):
+        started.set()
+        release.wait(5)
+        return data
+    blocker = processor.submit(_task("blocker", hold))
+    assert started.wait(5)
+    yield processor, release, blocker
+    release.set()
+    processor.shutdown()
+
+def test_submit_runs_higher_priority_first(blocked):
+    """Queued tasks run highest priority first, FIFO within a priority."""
+    processor, release, _ = blocked
+    order = []
+    futures = [
+        processor.submit(_task(task_id, order.append, priority))
+        for task_id, priority in [
+            ("low", ProcessingPriority.LOW),
+            ("medium-1", ProcessingPriority.MEDIUM),
+            ("high", ProcessingPriority.HIGH),
+            ("medium-2", ProcessingPriority.MEDIUM),
+        ]
+    ]
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+    assert order == ["high", "medium-1", "medium-2", "low"]
+
+def test_cancelled_task_is_skipped(blocked):
+    """A Future cancelled while queued never runs its processor."""
+    processor, release, _ = blocked
+    calls = []
+    cancelled = processor.submit(_task("cancelled", calls.append))
+    after = processor.submit(_task("after", lambda data: data))
+    assert cancelled.cancel()
+    release.set()
+    assert after.result(timeout=5) == "after"
+    assert calls == []
+    assert processor.get_result("cancelled") is None
+
+def test_shutdown_cancels_queued_futures(blocked):
+    """Tasks still queued at shutdown have their Futures cancelled, not left pending."""
+    processor, release, blocker = blocked
+    queued = processor.submit(_task("queued", lambda data: data))
+    
+    # The worker finishes its current task, then sees running is False
+    processor.running = False
+    release.set()
+    processor.shutdown()
+    assert blocker.result(timeout=5) == "blocker"
+    assert queued.cancelled()
+    
+    late = processor.submit(_task("late", lambda data: data))
+    with pytest.raises(RuntimeError):
+        late.result(timeout=5)
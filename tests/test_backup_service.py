@@ -0,0 +1,111 @@
+"""Tests for the backup service's copying and change detection."""
+import errno
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import backup_service as backup_module
+from src.core.backup_service import BackupService, COPY_BUFSIZE
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """A backup service working on a scratch tree under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    (tmp_path / "src" / "core").mkdir(parents=True)
+    backup_service = BackupService("backups")
+    yield backup_service
+    backup_service.shutdown()
+
+def test_file_written_after_copy_is_left_unindexed(service):
+    """A source that changed since the scan must not be indexed with its new hash."""
+    with open("changed.txt", "w") as f:
+        f.write("before")
+    st = os.stat("changed.txt")
+    scanned = {"changed.txt": (st.st_size, st.st_mtime_ns, None)}
+    
+    # Rewritten after the scan (and the copy) with a new mtime
+    with open("changed.txt", "w") as f:
+        f.write("after!")
+    os.utime("changed.txt", ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    service._index_copied_file(scanned, "changed.txt")
+    assert "changed.txt" not in scanned
+
+def test_unchanged_copy_is_indexed_with_its_hash(service):
+    """A source that still matches its scan is indexed with a content hash."""
+    with open("same.txt", "w") as f:
+        f.write("contents")
+    st = os.stat("same.txt")
+    scanned = {"same.txt": (st.st_size, st.st_mtime_ns, None)}
+    
+    service._index_copied_file(scanned, "same.txt")
+    assert scanned["same.txt"][:2] == (st.st_size, st.st_mtime_ns)
+    assert len(scanned["same.txt"][2]) == 64
+
+def _latest_manifest(kind: str) -> dict:
+    """Load the manifest of the newest backup of the given kind."""
+    latest = max(path for path in os.listdir("backups") if path.startswith(kind))
+    with open(os.path.join("backups", latest, "manifest.json")) as f:
+        return json.load(f)
+
+def test_incremental_backup_copies_changed_and_skips_touched(service):
+    """Changed and new files are copied; a touched but unchanged file is not."""
+    for name in ("changed.py", "touched.py"):
+        with open(os.path.join("src", "core", name), "w") as f:
+            f.write(f"# {name}\n")
+    
+    # First incremental run copies and indexes everything
+    service._last_backup_time = datetime.now() - timedelta(hours=1)
+    assert service.create_incremental_backup()
+    assert sorted(_latest_manifest("incremental")["changed_files"]) == [
+        os.path.join("src", "core", "changed.py"),
+        os.path.join("src", "core", "touched.py"),
+    ]
+    
+    # Backup directories are named to the second
+    time.sleep(1.1)
+    with open(os.path.join("src", "core", "changed.py"), "a") as f:
+        f.write("print('changed')\n")
+    with open(os.path.join("src", "core", "new.py"), "w") as f:
+        f.write("# new\n")
+    touched = os.path.join("src", "core", "touched.py")
+    st = os.stat(touched)
+    os.utime(touched, ns=(st.st_atime_ns, st.st_mtime_ns + 5 * 10 ** 9))
+    
+    assert service.create_incremental_backup()
+    manifest = _latest_manifest("incremental")
+    assert sorted(manifest["changed_files"]) == [
+        os.path.join("src", "core", "changed.py"),
+        os.path.join("src", "core", "new.py"),
+    ]
+    assert sorted(manifest["files"]) == sorted(manifest["changed_files"])
+
+def _no_clone(*args):
+    raise OSError(errno.EOPNOTSUPP, "clone not supported")
+
+@pytest.mark.parametrize("fallback", ["default", "sendfile", "copyfileobj", "copy2"])
+def test_fast_copy_fallbacks_produce_identical_files(tmp_path, monkeypatch, fallback):
+    """Every step of the copy fallback chain yields the same bytes and metadata."""
+    if fallback in ("sendfile", "copyfileobj"):
+        monkeypatch.setattr(backup_module, "fcntl", SimpleNamespace(ioctl=_no_clone))
+    if fallback == "copyfileobj":
+        monkeypatch.setattr(backup_module, "_sendfile", lambda *args: None)
+    if fallback == "copy2":
+        monkeypatch.setattr(backup_module, "_USE_SENDFILE", False)
+    
+    # Larger than one userspace buffer so the copy loops more than once
+    data = os.urandom(2 * COPY_BUFSIZE + 123)
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(data)
+    os.chmod(src, 0o640)
+    os.utime(src, ns=(1_600_000_000 * 10 ** 9, 1_600_000_000 * 10 ** 9))
+    
+    assert backup_module._fast_copy(src, dst) == len(data)
+    assert dst.read_bytes() == data
+    assert os.stat(dst).st_mode & 0o777 == 0o640
+    assert os.stat(dst).st_mtime_ns == os.stat(src).st_mtime_ns
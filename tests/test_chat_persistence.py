@@ -0,0 +1,61 @@
+"""Tests for batched chat message persistence."""
+import sqlite3
+import time
+
+from src.lef.core.chat_persistence import ChatPersistence, WRITE_BATCH_SIZE
+
+def test_unserializable_message_does_not_block_batch(tmp_path):
+    """One bad message is dropped; every valid message in its batch is written."""
+    persistence = ChatPersistence(db_path=str(tmp_path / "chat.db"))
+    
+    # Queue more than one batch, with a context json.dumps cannot encode
+    total = WRITE_BATCH_SIZE + 41
+    expected = sorted(f"message {i}" for i in range(total) if i != 10)
+    for i in range(total):
+        context = {"bad": object()} if i == 10 else None
+        persistence.save_message("session", "user", f"message {i}", context=context)
+    
+    # The running writer must get every valid message in without a restart
+    deadline = time.monotonic() + 5
+    while len(persistence.get_session_history("session")) < len(expected):
+        assert time.monotonic() < deadline, "valid messages were never written"
+        time.sleep(0.05)
+    persistence.stop_background_processing()
+    
+    contents = [message["content"] for message in persistence.get_session_history("session")]
+    assert sorted(contents) == expected
+    assert persistence.message_queue.empty()
+
+def test_shutdown_drain_writes_valid_messages(tmp_path):
+    """Messages queued at shutdown are written even if one of them is bad."""
+    persistence = ChatPersistence(db_path=str(tmp_path / "chat.db"))
+    persistence.save_message("session", "user", "first")
+    persistence.save_message("session", "user", "bad", context={"bad": object()})
+    persistence.save_message("session", "user", "last")
+    persistence.stop_background_processing()
+    
+    contents = [message["content"] for message in persistence.get_session_history("session")]
+    assert sorted(contents) == ["first", "last"]
+
+def test_writer_recovers_from_connection_failure(tmp_path):
+    """A failure to open the writer connection is retried, not fatal."""
+    persistence = ChatPersistence(db_path=str(tmp_path / "chat.db"))
+    persistence.stop_background_processing()
+    
+    connect_writer = persistence._connect_writer
+    attempts = []
+    def flaky_connect():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise sqlite3.OperationalError("unable to open database file")
+        return connect_writer()
+    persistence._connect_writer = flaky_connect
+    
+    persistence.start_background_processing()
+    persistence.save_message("session", "user", "after failure")
+    deadline = time.monotonic() + 5
+    while not persistence.get_session_history("session"):
+        assert time.monotonic() < deadline, "writer never recovered"
+        time.sleep(0.05)
+    persistence.stop_background_processing()
+    assert len(attempts) >= 2
@@ -0,0 +1,26 @@
+"""Tests for scripture-based decision scoring."""
+import pytest
+
+from harmony_wealth_engine import ScriptureBasedAgent
+
+ACTIONS = [
+    {"description": "Fund innovation and personal growth for systemic change"},
+    {"description": "Share resources generously with the community"},
+    {"description": "A plain action mentioning no principle at all"},
+    {},
+]
+
+def test_batch_evaluation_matches_single_evaluation():
+    """evaluate_decisions scores each action exactly like evaluate_decision."""
+    agent = ScriptureBasedAgent()
+    batch = agent.evaluate_decisions(ACTIONS)
+    assert len(batch) == len(ACTIONS)
+    for action, scores in zip(ACTIONS, batch):
+        expected = agent.evaluate_decision(action)
+        assert scores.keys() == expected.keys()
+        for principle, score in expected.items():
+            assert scores[principle] == pytest.approx(score)
+
+def test_batch_evaluation_of_no_actions():
+    """An empty batch scores to an empty list."""
+    assert ScriptureBasedAgent().evaluate_decisions([]) == []